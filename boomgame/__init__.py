@@ -13,14 +13,6 @@ else:
     import importlib.resources as importlib_resources  # type: ignore
 # pylint: enable=import-error
 
+from .version import __version__, display_version
 
-__version__ = "0.4.6"
 resources = importlib_resources.files("boomgame.data")
-
-
-def display_version() -> None:
-    """Entry point of boom_version command
-
-    Print the version on stdout
-    """
-    print(__version__)
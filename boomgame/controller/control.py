@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
-import json
 import enum
+import functools
+from typing import Dict, Union
+
+try:
+    import orjson as json_parser
+except ImportError:  # orjson is optional, fallback to the (slower) standard library
+    import json as json_parser  # type: ignore
 
 from pygame import locals as p_locals
 
@@ -32,6 +38,8 @@ class PlayerControl:
     from data/control/player{id}.txt
     """
 
+    __slots__ = ("identifier", "up", "down", "right", "left", "bombs")
+
     # XXX: A default for each player ?
     DEFAULT_UP = p_locals.K_UP  # type: ignore
     DEFAULT_DOWN = p_locals.K_DOWN  # type: ignore
@@ -47,39 +55,52 @@ class PlayerControl:
         self.left = self.DEFAULT_LEFT
         self.bombs = self.DEFAULT_BOMBS
 
-    def serialize(self) -> str:
-        return json.dumps(
-            {
-                "up": self.up,
-                "down": self.down,
-                "right": self.right,
-                "left": self.left,
-                "bombs": self.bombs,
-            }
-        )
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "up": self.up,
+            "down": self.down,
+            "right": self.right,
+            "left": self.left,
+            "bombs": self.bombs,
+        }
 
     @staticmethod
-    def unserialize(string: str, identifier: int) -> PlayerControl:
-        json_object = json.loads(string)
-
+    def from_dict(dict_: Dict[str, int], identifier: int) -> PlayerControl:
         control = PlayerControl(identifier)
-        control.up = json_object["up"]
-        control.down = json_object["down"]
-        control.right = json_object["right"]
-        control.left = json_object["left"]
-        control.bombs = json_object["bombs"]
+        control.up = dict_["up"]
+        control.down = dict_["down"]
+        control.right = dict_["right"]
+        control.left = dict_["left"]
+        control.bombs = dict_["bombs"]
 
         return control
 
+    def serialize(self) -> str:
+        serialized = json_parser.dumps(self.to_dict())
+        if isinstance(serialized, bytes):  # orjson dumps to bytes
+            return serialized.decode()
+        return serialized
+
+    @staticmethod
+    def unserialize(string: Union[str, bytes], identifier: int) -> PlayerControl:
+        return PlayerControl.from_dict(json_parser.loads(string), identifier)
+
     def save(self) -> None:
         resource = resources.joinpath("control").joinpath(f"player{self.identifier}.txt")
         with resource.open("w") as file:  # XXX: Writing here will not work if zipped or bundled
             file.write(self.serialize())
 
+        PlayerControl.from_identifier.cache_clear()
+
     @staticmethod
+    @functools.lru_cache(maxsize=8)
     def from_identifier(identifier: int) -> PlayerControl:
+        """Load the controls of a player (Parsed once and then kept in memory)
+
+        Note: The same instance is returned for an identifier until `save` is called.
+        """
         resource = resources.joinpath("control").joinpath(f"player{identifier}.txt")
-        if not resource.is_file():
+        try:
+            return PlayerControl.unserialize(resource.read_bytes(), identifier)
+        except FileNotFoundError:
             return PlayerControl(identifier)
-
-        return PlayerControl.unserialize(resource.read_text(), identifier)
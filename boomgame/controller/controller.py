@@ -5,7 +5,7 @@ Handle all the events.
 
 from __future__ import annotations
 
-from typing import List
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import pygame.event
 
@@ -25,6 +25,12 @@ class GameController:
         self.model = model
         self.player_controllers = [PlayerController(model.players[identifier]) for identifier in model.players]
 
+        # Each key is dispatched to the first player controller using it
+        self.key_owner: Dict[int, PlayerController] = {}
+        for controller in self.player_controllers:
+            for key in controller.keys():
+                self.key_owner.setdefault(key, controller)
+
     def handle_user_event(self, event: pygame.event.Event) -> bool:
         """Handle all the graphical events.
 
@@ -39,10 +45,30 @@ class GameController:
             # FIXME: If a player key is pressed it could be stored ?
             return False
 
-        for controller in self.player_controllers:
-            if controller.handle_user_event(event):
-                return True
-        return False
+        if event.type not in (control.TypeControl.KEY_DOWN, control.TypeControl.KEY_UP):
+            return False
+
+        owner = self.key_owner.get(event.key)
+        if owner is None:
+            return False
+        return owner.handle_user_event(event)
+
+    def handle_user_events(self, events: Iterable[pygame.event.Event]) -> None:
+        """Handle a batch of graphical events (Typically all the events received since the last tick).
+
+        Args:
+            events (Iterable[pygame.event.Event]): The events received, in order.
+        """
+        if not self.model.state.RUNNING:
+            return
+
+        key_types = (control.TypeControl.KEY_DOWN, control.TypeControl.KEY_UP)
+        key_owner = self.key_owner
+        for event in events:
+            if event.type in key_types:
+                owner = key_owner.get(event.key)
+                if owner is not None:
+                    owner.handle_user_event(event)
 
     def tick(self, delta_time: float) -> None:
         """Called at each time step.
@@ -62,20 +88,35 @@ class PlayerController:
     """Handle keys for a given player and its controls.
 
     Each key event will update the direction, and the bombing behavior of the player.
+
+    The directions pressed are stacked in a single int: each direction is coded on 4 bits
+    (See DIRECTIONS), the last pressed being in the lowest bits. 0 means empty.
     """
 
+    DIRECTIONS: Tuple[Optional[vector.Direction], ...] = (
+        None,
+        vector.Direction.UP,
+        vector.Direction.DOWN,
+        vector.Direction.RIGHT,
+        vector.Direction.LEFT,
+    )
+
     def __init__(self, player: entity.Player) -> None:
         self.player = player
         self.player_control = control.PlayerControl.from_identifier(self.player.identifier)
         self.key_to_direction = {
-            self.player_control.up: vector.Direction.UP,
-            self.player_control.down: vector.Direction.DOWN,
-            self.player_control.right: vector.Direction.RIGHT,
-            self.player_control.left: vector.Direction.LEFT,
+            self.player_control.up: self.DIRECTIONS.index(vector.Direction.UP),
+            self.player_control.down: self.DIRECTIONS.index(vector.Direction.DOWN),
+            self.player_control.right: self.DIRECTIONS.index(vector.Direction.RIGHT),
+            self.player_control.left: self.DIRECTIONS.index(vector.Direction.LEFT),
         }
-        self.direction_pressed: List[int] = []
+        self.direction_pressed = 0
         self.bombing = False
 
+    def keys(self) -> List[int]:
+        """Keys used by this player"""
+        return [self.player_control.bombs, *self.key_to_direction]
+
     def handle_user_event(self, event: pygame.event.Event) -> bool:
         """Handle an event for the player concerned.
 
@@ -92,23 +133,28 @@ class PlayerController:
             self.bombing = event.type == control.TypeControl.KEY_DOWN
             return True
 
-        if event.key not in self.key_to_direction:
+        direction = self.key_to_direction.get(event.key)  # Single lookup for the key
+        if direction is None:
             return False
 
         if event.type == control.TypeControl.KEY_DOWN:
-            assert event.key not in self.direction_pressed
-            self.direction_pressed.append(event.key)
+            self.direction_pressed = (self.direction_pressed << 4) | direction
         elif event.type == control.TypeControl.KEY_UP:
-            self.direction_pressed.remove(event.key)
-
-        if not self.direction_pressed:
-            self.player.set_wanted_direction(None)
-        else:
-            self.player.set_wanted_direction(self.key_to_direction[self.direction_pressed[-1]])
+            # Drop the direction from the stack, keeping the order of the others
+            stack, kept, shift = self.direction_pressed, 0, 0
+            while stack:
+                if stack & 0xF == direction:
+                    self.direction_pressed = kept | (stack >> 4) << shift
+                    break
+                kept |= (stack & 0xF) << shift
+                stack >>= 4
+                shift += 4
+
+        self.player.set_wanted_direction(self.DIRECTIONS[self.direction_pressed & 0xF])
 
         return True
 
     def tick(self, _delta_time: float) -> None:
-        if self.bombing:
+        if self.bombing and self.player.can_bomb():
             self.player.bombs()  # Try to bomb at each time step when bombing
         # Note that entity update is done by game controller, no need to redo it.
@@ -1,29 +1,28 @@
 """Provides the base Event class, used in our Observer/Observable pattern."""
 
 
-class MetaEvent(type):
-    """Metaclass of all the events.
-
-    Use to auto_increment the event ID.
-    """
-
-    id_counter = 0
-
-    def __init__(cls, cls_name: str, bases: tuple, attributes: dict) -> None:
-        super().__init__(cls_name, bases, attributes)
-        cls.ID = MetaEvent.id_counter
-        MetaEvent.id_counter += 1
+class Event:
+    """Event base class.
 
+    Each subclass is given a unique ID at its creation. Events are slotted: subclasses
+    should declare their own attributes in `__slots__`.
 
-class Event(metaclass=MetaEvent):
-    """Event base class.
+    Events sent very often (at each frame) can be built once and sent again: observers should not keep them.
 
     Attr:
-        ID (int): Unique class identifier defined by the metaclass
+        ID (int): Unique class identifier
         handled (bool): Set to true when the event is handled.
     """
 
-    ID: int
+    __slots__ = ("handled",)
+
+    ID = 0
+    _id_counter = 1
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.ID = Event._id_counter
+        Event._id_counter += 1
 
     def __init__(self) -> None:
         self.handled = False
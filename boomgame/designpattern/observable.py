@@ -1,6 +1,6 @@
 """Provides the Observable class of the design pattern observer/observable."""
 
-from typing import Set
+from typing import Callable, Set, Tuple
 
 from . import observer
 from . import event
@@ -10,23 +10,32 @@ class Observable:
     """Observable objects can be observed.
 
     Observers can be added and each observer is notify with an event when the observable is changed.
+
+    The bound `notify` methods of the observers are cached (and rebuilt only when observers change)
+    so that `changed` does not look them up at each call.
     """
 
+    __slots__ = ("observers", "_notifiers")
+
     def __init__(self) -> None:
         self.observers: Set[observer.Observer] = set()
+        self._notifiers: Tuple[Callable[[event.Event], None], ...] = ()
 
     def add_observer(self, observer_: observer.Observer) -> None:
         self.observers.add(observer_)
+        self._notifiers = tuple(observer_.notify for observer_ in self.observers)
 
     def remove_observer(self, observer_: observer.Observer) -> None:
         self.observers.remove(observer_)
+        self._notifiers = tuple(observer_.notify for observer_ in self.observers)
 
     def reset(self) -> None:
         self.observers = set()
+        self._notifiers = ()
 
     def changed(self, event_: event.Event) -> None:
-        for observer_ in self.observers:
-            observer_.notify(event_)
+        for notify in self._notifiers:
+            notify(event_)
 
         # Sanity check
         # if not event_.handled:
@@ -4,22 +4,16 @@ from __future__ import annotations
 
 import asyncio
 import enum
-from typing import Dict, Tuple
+import math
+import sys
+import time
+from typing import List, Optional, Tuple
 
 import pygame
-import pygame.display
-import pygame.event
-import pygame.locals
-import pygame.rect
-import pygame.surface
-import pygame.time
-import pygame.transform
-
-from boomgame.designpattern import event
 
 from .controller import control, controller
 from .designpattern import event, observer
-from .menu import menu
+from .menu import menu, prefetch
 from .model import game, events
 from .sound import game_sound
 from .view import animation, game_view, view
@@ -37,17 +31,46 @@ class BoomGame(observer.Observer):
         RUNNING = 2
         # PAUSE = 3
 
+    FPS = 48
+    IDLE_TIMEOUT = 1000  # Max time (ms) to wait for an event while idle
+    # Blocking waits would freeze the browser in the web version (pygbag)
+    BLOCKING_WAIT = sys.platform != "emscripten"
+    USER_EVENTS = (pygame.locals.MOUSEMOTION, pygame.locals.MOUSEBUTTONDOWN, pygame.locals.MOUSEBUTTONUP)
+    MAX_DIRTY_RECTS = 5  # Above this number of changed areas, the whole window is updated
+
     def __init__(self) -> None:
         self.state = self.State.LOADING
+        prefetch()  # Read the menu files while the display is initialized
 
         # Init the display
         width, height = pygame.display.Info().current_w, pygame.display.Info().current_h
-        pygame.display.set_mode((int(width * 3 / 4), int(height * 3 / 4)), pygame.locals.RESIZABLE)  # type: ignore
+        pygame.display.set_mode(  # type: ignore
+            (int(width * 3 / 4), int(height * 3 / 4)), pygame.locals.RESIZABLE | pygame.locals.DOUBLEBUF
+        )
         pygame.display.set_caption("BOOM")
         pygame.display.set_icon(view.load_image("game_icon.png"))
         self.running = True
+        self.dirty = True  # Whether the display has to be redrawn (Views may also have their own dirty state)
+        self.view_surface: Optional[pygame.surface.Surface] = None  # Last frame of the view (before scaling)
+        self.window_size = (0, 0)
         self.offset = (0.0, 0.0)
         self.ratio = 1.0
+        self.inv_ratio = 1.0
+
+        # Drop at SDL level the events that are never used (Mouse motion is only needed by the menu)
+        pygame.event.set_blocked(
+            [
+                pygame.locals.MOUSEWHEEL,
+                pygame.locals.TEXTEDITING,
+                pygame.locals.TEXTINPUT,
+                pygame.locals.FINGERDOWN,
+                pygame.locals.FINGERMOTION,
+                pygame.locals.FINGERUP,
+                pygame.locals.JOYAXISMOTION,
+                pygame.locals.JOYBALLMOTION,
+                pygame.locals.JOYHATMOTION,
+            ]
+        )
 
         # Init all the components
         self.loading_animation = animation.LoadingAnimation()
@@ -65,6 +88,9 @@ class BoomGame(observer.Observer):
         if hasattr(event_, "pos"):
             event_.pos = self.scale(event_.pos)
 
+        if event_.type not in self.USER_EVENTS:
+            self.dirty = True  # Window events (resize, expose, ...) require to redraw
+
         if self.state == self.State.LOADING:
             return
 
@@ -75,12 +101,34 @@ class BoomGame(observer.Observer):
             # PAUSE ?
             self.game_controller.handle_user_event(event_)
 
+    def handle_events(self) -> None:
+        """Handle all the pending pygame events, grouped by type"""
+        events_ = pygame.event.get()  # A single batch: no event can arrive (and be lost) in between
+        if any(event_.type == control.TypeControl.QUIT for event_ in events_):
+            self.running = False
+            return
+
+        if self.state == self.State.RUNNING:
+            # Only keys matter while playing: no need to scale positions, other events are dropped
+            self.game_controller.handle_user_events(
+                [
+                    event_
+                    for event_ in events_
+                    if event_.type in (control.TypeControl.KEY_DOWN, control.TypeControl.KEY_UP)
+                ]
+            )
+            return
+
+        for event_ in events_:
+            self.handle(event_)
+
     def forward(self, delta_time: float) -> None:
         """Forward time in the game"""
         if self.state == self.State.LOADING:
             self.loading_animation.forward(delta_time)
             if self.loading_animation.done:
                 self.state = self.State.MENU
+                self.dirty = True
 
         if self.state == self.State.MENU:
             self.menu.update(delta_time)
@@ -92,51 +140,126 @@ class BoomGame(observer.Observer):
         if isinstance(event_, events.GameEndEvent):
             self.menu = menu.Menu(self.start_game, self.quit)  # Reset the menu
             self.state = self.State.MENU
+            self.dirty = True
+            pygame.event.set_allowed(pygame.locals.MOUSEMOTION)
+
+    @property
+    def need_display(self) -> bool:
+        """Only the menu can be static, other states are always animated"""
+        return self.dirty or self.state != self.State.MENU or self.menu.dirty
+
+    @property
+    def idle(self) -> bool:
+        """Nothing to animate until the next user event"""
+        return self.state == self.State.MENU and not self.need_display and not self.menu.animated
+
+    def display(self) -> Optional[List[pygame.rect.Rect]]:
+        """Display the game on the main surface
+
+        Returns:
+            Optional[List[pygame.rect.Rect]]: The areas of the window that have changed.
+                None when the whole window should be updated.
+        """
+        view_: view.View
+        if self.state == self.State.LOADING:
+            view_ = self.loading_animation
+        elif self.state == self.State.MENU:
+            view_ = self.menu
+        else:
+            view_ = self.game_view
+
+        size = view_.size
+        surface = pygame.display.get_surface()
+        width, height = surface.get_size()
 
-    def display(self):
-        """Display the game on the main surface"""
-        views: Dict[BoomGame.State, view.View] = {
-            BoomGame.State.LOADING: self.loading_animation,
-            BoomGame.State.MENU: self.menu,
-            BoomGame.State.RUNNING: self.game_view,
-        }
+        # Let's draw on a surface that matches the size of the view (kept from one frame to another)
+        full_display = self.dirty or self.window_size != (width, height)
+        if self.view_surface is None or self.view_surface.get_size() != size:
+            self.view_surface = pygame.surface.Surface(size).convert_alpha()
+            full_display = True
+        self.dirty = False
+        self.window_size = (width, height)
 
-        size = views[self.state].size
+        changes = None
+        if not full_display and view_ is self.menu:  # Only redraw what has changed
+            changes = self.menu.display_changes(self.view_surface)
 
-        # Let's draw on a temporary surface that matches the size of the view
-        real_game_surface = pygame.surface.Surface(size).convert_alpha()
-        views[self.state].display(real_game_surface)
+        if changes is None:
+            self.view_surface.fill((0, 0, 0, 0))
+            view_.display(self.view_surface)
+            surface.fill((0, 0, 0))
 
         # Draw on the real surface and inflate at maximum size
-        surface = pygame.display.get_surface()
-        surface.fill((0, 0, 0))
-
-        width, height = surface.get_size()
         self.ratio = min(width / size[0], height / size[1])
+        self.inv_ratio = 1 / self.ratio
         game_size = (int(size[0] * self.ratio), int(size[1] * self.ratio))
 
         game_rect = pygame.rect.Rect(((width - game_size[0]) // 2, (height - game_size[1]) // 2), game_size)
         self.offset = (game_rect.x, game_rect.y)
         inflated_game_surface = surface.subsurface(game_rect)
 
-        pygame.transform.scale(real_game_surface, game_size, inflated_game_surface)
+        pygame.transform.scale(self.view_surface, game_size, inflated_game_surface)
+
+        if changes is None or len(changes) > self.MAX_DIRTY_RECTS:
+            return None
+
+        return [
+            pygame.rect.Rect(
+                (self.offset[0] + int(rect.left * self.ratio), self.offset[1] + int(rect.top * self.ratio)),
+                (math.ceil(rect.width * self.ratio) + 1, math.ceil(rect.height * self.ratio) + 1),
+            ).clip(game_rect)
+            for rect in changes
+        ]
+
+    def wait_event(self, timeout: int) -> None:
+        """Wait for a single event (at most timeout ms) and handle it"""
+        event_ = pygame.event.wait(timeout)
+        if event_.type == pygame.locals.NOEVENT:
+            return
+
+        if event_.type == control.TypeControl.QUIT:
+            self.running = False
+        elif self.state == self.State.RUNNING:
+            self.game_controller.handle_user_events((event_,))
+        else:
+            self.handle(event_)
 
     async def async_main(self):
-        timer = pygame.time.Clock()
+        frame_delay = 1 / self.FPS
+        last_time = time.monotonic()
         while self.running:
-            for event_ in pygame.event.get():
-                if event_.type == control.TypeControl.QUIT:
-                    self.running = False
-                    break
-                self.handle(event_)
+            self.handle_events()
+            if not self.running:
+                break
 
-            delta_time = timer.tick(48) / 1000
+            frame_time = time.monotonic()
+            delta_time = frame_time - last_time
+            last_time = frame_time
             self.forward(delta_time)
 
-            self.display()
-            pygame.display.flip()
+            if self.need_display:
+                changes = self.display()
+                if changes is None:
+                    pygame.display.flip()
+                else:
+                    pygame.display.update(changes)
             await asyncio.sleep(0)
 
+            if self.BLOCKING_WAIT and self.idle:
+                # Sleep until the user does something instead of redrawing the same frame
+                self.wait_event(self.IDLE_TIMEOUT)
+                last_time = time.monotonic()  # Do not forward the idle time
+                continue
+
+            # Wait for the next frame, handling events as soon as they arrive
+            remaining = frame_delay - (time.monotonic() - frame_time)
+            while remaining > 0 and self.running:
+                if self.BLOCKING_WAIT:
+                    self.wait_event(max(1, int(remaining * 1000)))
+                else:
+                    await asyncio.sleep(remaining)
+                remaining = frame_delay - (time.monotonic() - frame_time)
+
     def main(self):
         asyncio.run(self.async_main())
 
@@ -150,10 +273,12 @@ class BoomGame(observer.Observer):
 
     def scale(self, pos: Tuple[int, int]) -> Tuple[int, int]:
         """Scale mouse pos"""
-        return (int((pos[0] - self.offset[0]) / self.ratio), int((pos[1] - self.offset[1]) / self.ratio))
+        offset, inv_ratio = self.offset, self.inv_ratio
+        return (int((pos[0] - offset[0]) * inv_ratio), int((pos[1] - offset[1]) * inv_ratio))
 
     def start_game(self, two_players: bool, maze_solved: int):
         self.state = self.State.RUNNING
+        pygame.event.set_blocked(pygame.locals.MOUSEMOTION)  # Useless while playing
         self.game = game.GameModel("boom", two_players)
         self.game.add_observer(self)
         self.game.maze_solved = maze_solved
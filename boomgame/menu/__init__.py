@@ -1 +1,47 @@
 """Menu GUI using pygame-gui"""
+
+import functools
+import json
+import sys
+import threading
+
+from .. import resources
+
+
+@functools.lru_cache(maxsize=None)
+def load_json(*path: str) -> dict:
+    """Load a json file from the data folder (boomgame/data).
+
+    Files are parsed once and then kept in memory. The returned object is shared: it should not be modified.
+
+    Args:
+        *path (str): Path of the file inside the data folder (ex: "theme", "default.json")
+
+    Return:
+        dict: The parsed json.
+    """
+    resource = resources
+    for part in path:
+        resource = resource.joinpath(part)
+
+    return json.loads(resource.read_text())
+
+
+def prefetch() -> None:
+    """Load in background all the json files of the menu (pages, languages and themes)
+
+    Further calls to `load_json` are then served from memory. Nothing is done in the web version (no threads).
+    """
+    if sys.platform == "emscripten":
+        return
+
+    def _load_all():
+        for folder in (("menu",), ("menu", "lang"), ("theme",)):
+            resource = resources
+            for part in folder:
+                resource = resource.joinpath(part)
+            for file in resource.iterdir():
+                if file.name.endswith(".json"):
+                    load_json(*folder, file.name)
+
+    threading.Thread(target=_load_all, daemon=True).start()
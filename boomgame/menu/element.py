@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import List, Optional, Tuple
+
 import pygame
 
 from ..view import panel_view, view, inflate_to_reality, TILE_SIZE
@@ -14,9 +16,20 @@ class Element(view.ImageView):
         self.properties = properties
         self.page = page
         self.shadow_offset = inflate_to_reality((self.properties.z, self.properties.z))
+        self.dirty = True  # Set when the element should be displayed again
+        self._shadow: Optional[Tuple[pygame.surface.Surface, pygame.surface.Surface]] = None  # (image, shadow)
 
     def display(self, surface: pygame.surface.Surface) -> None:
-        panel_view.display_with_shadow(surface, self.image, self.top_left_position, self.shadow_offset)
+        surface.blits(self.blit_args(), doreturn=False)
+
+    def blit_args(self) -> List[Tuple[pygame.surface.Surface, Tuple[int, int]]]:
+        """Blit sequence of the element (for `Surface.blits`)
+
+        The shadow is only rebuilt when the image changes.
+        """
+        if self._shadow is None or self._shadow[0] is not self.image:
+            self._shadow = (self.image, panel_view.build_shadow(self.image))
+        return panel_view.shadow_blits(self.image, self.top_left_position, self.shadow_offset, self._shadow[1])
 
     @property
     def top_left_position(self):
@@ -54,11 +67,28 @@ class Element(view.ImageView):
 
 
 class InteractiveElement(Element):
+    """Element that reacts to the mouse
+
+    Only the event types in `INTERESTED_EVENT_TYPES` are given to `handle_event`.
+    """
+
+    INTERESTED_EVENT_TYPES = frozenset((pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP))
+
     def __init__(self, page: menu.Page, properties: element_properties.ElementProperties) -> None:
         super().__init__(page, properties)
         self.hovered = False
         self._clicked = False
         self.clicked = False
+        self.displayed_rect: Optional[pygame.Rect] = None
+
+    def display(self, surface: pygame.surface.Surface) -> None:
+        super().display(surface)
+        self.mark_displayed()
+
+    def mark_displayed(self) -> None:
+        """Record that the element has just been displayed (through `display` or `blit_args`)"""
+        self.displayed_rect = self.rect
+        self.dirty = False
 
     @property
     def rect(self) -> pygame.Rect:
@@ -83,9 +113,17 @@ class InteractiveElement(Element):
             if hovered:  # Trigger a real click only if still hovered
                 self.click()
 
+    def reset(self) -> None:
+        """Forget the hover and click states (e.g. when its page is shown again)"""
+        if self.hovered:
+            self.hover(False)
+        self._clicked = False
+        self.clicked = False
+
     def hover(self, hovered: bool):
         """Called when the state over changes"""
         self.hovered = hovered
+        self.dirty = True
 
     def update(self, delay: float):
         """Update the optional animation of the object"""
@@ -127,6 +165,7 @@ class TextElement(Element):
         # TODO: Handle variables
         self.properties.text = text
         self.image = self.font.render(text, True, self.properties.text_color).convert_alpha()
+        self.dirty = True
         width, height = self.image.get_size()
         self.size = (width + self.shadow_offset[0], height + self.shadow_offset[1])
 
@@ -141,6 +180,10 @@ class ButtonElement(TextElement, InteractiveElement):
         self.properties: element_properties.ButtonProperties
         self.clicked_delay = self.properties.clicked_delay
 
+    def reset(self) -> None:
+        super().reset()
+        self.clicked_delay = self.properties.clicked_delay
+
     def hover(self, hovered: bool):
         super().hover(hovered)
         text_color = self.properties.text_color_hovered if hovered else self.properties.text_color
@@ -152,6 +195,7 @@ class ButtonElement(TextElement, InteractiveElement):
             use_hovered = int(self.clicked_delay / self.COLOR_SWITCH_DELAY) % 2
             text_color = self.properties.text_color_hovered if use_hovered else self.properties.text_color
             self.image = self.font.render(self.properties.text, True, text_color).convert_alpha()
+            self.dirty = True
             if self.clicked_delay < 0:
                 self.clicked = False
                 self.clicked_delay = self.properties.clicked_delay
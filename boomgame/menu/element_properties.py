@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import dataclasses
-from typing import Optional, Tuple
+import functools
+from typing import Any, Optional, Tuple
 
 from . import theme
 
@@ -25,6 +26,9 @@ class ElementProperties:
         z (float): Offset of the shadow (depth) in tile unit
     """
 
+    # Slots are declared manually (dataclass(slots=True) requires python 3.10)
+    __slots__ = ("pos", "z", "align")
+
     pos: Tuple[float, float]
     z: float
     align: str
@@ -34,19 +38,23 @@ class ElementProperties:
         klass = element_dict.get("style", element_dict["element"])
 
         kwargs = {}
-        for property_, field in cls.__dataclass_fields__.items():  # pylint: disable=no-member
+        for property_, default in cls.fields_spec():
             if property_ in element_dict:
                 kwargs[property_] = element_dict[property_]
             else:
-                default = (
-                    None
-                    if isinstance(field.default, dataclasses._MISSING_TYPE)  # pylint: disable=protected-access
-                    else field.default
-                )
                 kwargs[property_] = page_theme.get(klass, property_, default)
 
         return cls(**kwargs)
 
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def fields_spec(cls) -> Tuple[Tuple[str, Any], ...]:
+        """Name and default value (None if no default) of each field. Computed once by class."""
+        return tuple(
+            (field.name, None if field.default is dataclasses.MISSING else field.default)
+            for field in dataclasses.fields(cls)
+        )
+
 
 @dataclasses.dataclass
 class TextProperties(ElementProperties):
@@ -60,6 +68,8 @@ class TextProperties(ElementProperties):
 
     """
 
+    __slots__ = ("text", "font_name", "font_size", "text_color")
+
     text: str
     font_name: str
     font_size: float
@@ -76,6 +86,8 @@ class ImageProperties(ElementProperties):
 
     """
 
+    __slots__ = ("image_name", "image_size")
+
     image_name: str
     image_size: Optional[Tuple[float, float]]
 
@@ -92,6 +104,8 @@ class ButtonProperties(TextProperties):
 
     """
 
+    __slots__ = ("text_color_hovered", "clicked_delay", "action")
+
     text_color_hovered: str
     clicked_delay: float
     action: str
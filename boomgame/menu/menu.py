@@ -1,14 +1,12 @@
 from __future__ import annotations
 
 import enum
-import json
-from typing import Callable, Dict, List
+from typing import Callable, Dict, List, Optional
 
 import pygame.surface
 
-from .. import resources
 from ..view import view, inflate_to_reality
-from . import actions, element, theme
+from . import actions, element, load_json, theme
 
 # TODO: Other pages + settings
 
@@ -39,13 +37,42 @@ class Menu(view.View):
     def __init__(self, start_callback, quit_callback) -> None:
         super().__init__((0, 0), inflate_to_reality(self.SIZE))
         self.lang = "en"
-        resource = resources.joinpath("menu").joinpath("lang").joinpath(f"{self.lang}.json")
-        self.traductions: Dict[str, str] = json.loads(resource.read_text())
-        self.page = Page(PageEnum.MAIN, PageEnum.MAIN, self)
+        self.traductions: Dict[str, str] = load_json("menu", "lang", f"{self.lang}.json")
+        self.pages: Dict[PageEnum, Page] = {}  # Pages are built once and reused when visited again
+        self.page = self.get_page(PageEnum.MAIN, PageEnum.MAIN)
+        self.displayed_page: Optional[Page] = None
 
         self.start_callback = start_callback
         self.quit_callback = quit_callback
 
+    def get_page(self, page: PageEnum, previous: PageEnum) -> Page:
+        """Get the page (Built at the first call)
+
+        A page already built is reset: its elements forget their hover and click states.
+
+        Args:
+            page (PageEnum): The page to get
+            previous (PageEnum): The page to go back to (Only used when the page is built)
+
+        Returns:
+            Page: The page
+        """
+        if page not in self.pages:
+            self.pages[page] = Page(page, previous, self)
+        else:
+            self.pages[page].reset()
+        return self.pages[page]
+
+    @property
+    def dirty(self) -> bool:
+        """Whether the menu has changed since its last display"""
+        return self.page is not self.displayed_page or self.page.dirty
+
+    @property
+    def animated(self) -> bool:
+        """Whether the menu is animated and should be updated even without user events"""
+        return self.page.animated
+
     def update(self, delay: float):
         self.page.update(delay)
 
@@ -54,6 +81,13 @@ class Menu(view.View):
 
     def display(self, surface: pygame.surface.Surface) -> None:
         self.page.display(surface)
+        self.displayed_page = self.page
+
+    def display_changes(self, surface: pygame.surface.Surface) -> Optional[List[pygame.rect.Rect]]:
+        """See `Page.display_changes`"""
+        if self.page is not self.displayed_page:  # The surface holds another page
+            return None
+        return self.page.display_changes(surface)
 
 
 class Page(view.View):
@@ -68,8 +102,7 @@ class Page(view.View):
             action: getattr(actions, action) for action in self.menu.actions[self.page]
         }
 
-        resource = resources.joinpath("menu").joinpath(f"{page.value}.json")
-        page_config = json.loads(resource.read_text())
+        page_config = load_json("menu", f"{page.value}.json")
         self.theme = theme.Theme(page_config["theme"])
 
         self.interactive_elements: List[element.InteractiveElement] = []
@@ -82,29 +115,103 @@ class Page(view.View):
             else:
                 self.static_elements.append(element_)
 
+        # Dispatch table: event type -> interested elements
+        self.dispatch: Dict[int, List[element.InteractiveElement]] = {}
+        for interactive_element in self.interactive_elements:
+            for event_type in interactive_element.INTERESTED_EVENT_TYPES:
+                self.dispatch.setdefault(event_type, []).append(interactive_element)
+
+        self.displayed = False
+
         ## Build the background once for all
-        self.background = pygame.surface.Surface(self.size).convert_alpha()
+        self.background = pygame.surface.Surface(self.size).convert()  # Opaque: faster blits
         self._build_background()
 
     def _build_background(self) -> None:
         """Build the background surface"""
-        background_tile = view.load_image(self.theme.background, inflate_to_reality(self.theme.background_size))
+        background_tile = view.load_image(self.theme.background, self.theme.background_real_size)
+
+        # Tiles positions are computed once per row and column
+        height, width = self.menu.SIZE
+        step_i, step_j = int(self.theme.background_size[0]), int(self.theme.background_size[1])
+        rows = [inflate_to_reality((i, 0))[1] for i in range(0, height, step_i)]
+        columns = [inflate_to_reality((0, j))[0] for j in range(0, width, step_j)]
 
-        for i in range(0, self.menu.SIZE[0], int(self.theme.background_size[0])):
-            for j in range(0, self.menu.SIZE[1], int(self.theme.background_size[1])):
-                self.background.blit(background_tile, inflate_to_reality((i, j)))
+        blit_sequence = [(background_tile, (x, y)) for y in rows for x in columns]
 
         for element_ in self.static_elements:
-            element_.display(self.background)
+            blit_sequence.extend(element_.blit_args())
+
+        self.background.blits(blit_sequence, doreturn=False)
+
+    def reset(self) -> None:
+        """Reset the state of the interactive elements"""
+        for element_ in self.interactive_elements:
+            element_.reset()
+
+    @property
+    def dirty(self) -> bool:
+        """Whether the page has changed since its last display"""
+        return not self.displayed or any(element_.dirty for element_ in self.interactive_elements)
+
+    @property
+    def animated(self) -> bool:
+        return any(element_.clicked for element_ in self.interactive_elements)
 
     def display(self, surface: pygame.surface.Surface) -> None:
-        surface.blit(self.background, self.position)
+        blit_sequence = [(self.background, self.position)]
+        for element_ in self.interactive_elements:
+            blit_sequence.extend(element_.blit_args())
+        surface.blits(blit_sequence, doreturn=False)
+
+        for element_ in self.interactive_elements:
+            element_.mark_displayed()
+
+        self.displayed = True
+
+    def display_changes(self, surface: pygame.surface.Surface) -> Optional[List[pygame.rect.Rect]]:
+        """Only redraw the elements that have changed since the last display
 
+        Args:
+            surface (pygame.surface.Surface): Surface where the page was last displayed
+
+        Returns:
+            Optional[List[pygame.rect.Rect]]: Areas of the surface that have been redrawn.
+                None if the page has never been displayed (and nothing has been drawn).
+        """
+        if not self.displayed:
+            return None
+
+        changes = []
         for element_ in self.interactive_elements:
-            element_.display(surface)
+            if element_.dirty:
+                rect = element_.rect
+                if element_.displayed_rect:
+                    rect.union_ip(element_.displayed_rect)
+                changes.append(rect)
+
+        # Restore each changed area and redraw the elements touching it, clipped to the area:
+        # outside of it, the elements are already drawn (and blending them again would alter them)
+        clip = surface.get_clip()
+        redrawn = []
+        for rect in changes:
+            surface.set_clip(rect)
+            surface.blit(self.background, rect, rect)
+            blit_sequence = []
+            for element_ in self.interactive_elements:
+                if element_.rect.colliderect(rect):
+                    blit_sequence.extend(element_.blit_args())
+                    redrawn.append(element_)
+            surface.blits(blit_sequence, doreturn=False)
+        surface.set_clip(clip)
+
+        for element_ in redrawn:
+            element_.mark_displayed()
+
+        return changes
 
     def handle_event(self, event):
-        for interactive_element in self.interactive_elements:
+        for interactive_element in self.dispatch.get(event.type, ()):
             interactive_element.handle_event(event)
 
     def update(self, delay: float):
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import json
-from typing import Tuple
+from typing import Any, Dict, Tuple
 
-from .. import resources
+from ..view import inflate_to_reality
+from . import load_json
 
 
 class Theme:  # Ugly
@@ -25,20 +25,29 @@ class Theme:  # Ugly
     """
 
     DEFAULT = "__default"
+    _MISSING = object()
 
     def __init__(self, name: str) -> None:
-        resource = resources.joinpath("theme").joinpath(f"{name}.json")
-        self.data: dict = json.loads(resource.read_text())
+        self.data: dict = load_json("theme", f"{name}.json")
         self.background: str = self.data["background"]
         self.background_size: Tuple[float, float] = self.data["background_size"]
+        self.background_real_size = inflate_to_reality(self.background_size)
+
+        # Flat view of the properties: (klass, property) -> value
+        self.properties: Dict[Tuple[str, str], Any] = {
+            (klass, property_): value
+            for klass, properties in self.data.items()
+            if isinstance(properties, dict)
+            for property_, value in properties.items()
+        }
 
     def get(self, klass: str, property_: str, default=None):
-        if klass in self.data:
-            if property_ in self.data[klass]:
-                return self.data[klass][property_]
-        if self.DEFAULT in self.data:
-            if property_ in self.data[self.DEFAULT]:
-                return self.data[self.DEFAULT][property_]
+        value = self.properties.get((klass, property_), self._MISSING)
+        if value is not self._MISSING:
+            return value
+        value = self.properties.get((self.DEFAULT, property_), self._MISSING)
+        if value is not self._MISSING:
+            return value
 
         if default is None:
             raise KeyError(f"Unable to find property {property_} for class {klass}")
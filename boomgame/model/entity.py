@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import enum
+import functools
 import math
 import random
 from typing import cast, Dict, List, Optional, Set, Tuple
@@ -38,8 +39,12 @@ class Damage:
     """Damage done to entities
 
     Two types: Damage from bombs. And damage from the enemies.
+
+    Damages should not be modified: each entity builds its damage once and reuses it for all its hits.
     """
 
+    __slots__ = ("entity", "damage", "type", "type_bit")
+
     class Type(enum.Enum):
         ENEMIES = 0
         BOMBS = 1
@@ -48,19 +53,33 @@ class Damage:
         self.entity = entity
         self.damage = damage
         self.type = type_
+        self.type_bit = 1 << type_.value  # Checked against the vulnerability mask of the entities
+
+
+NOT_REMOVING = timer.InactiveTimer(increase=False)  # Shared removing timer of the entities not yet removing
 
 
 class EntityClass(type):
     """Entity metaclass.
 
+    Entities have a fixed set of attributes: classes that do not define `__slots__` get an empty one,
+    so that no `__dict__` is built for each entity.
+
     Attr:
         REPR (Optional[str]):
         representation_to_entity_class (Dict[str, EntityClass]): Mapping from class.REPR to class for all
             EntityClass that are representable. (<=> define REPR attr)
+        vulnerability_mask (int): VULNERABILITIES of the class as a bit mask (bit k <=> Damage.Type of value k)
     """
 
     REPR: str = ""
+    VULNERABILITIES: List[Damage.Type] = []
     representation_to_entity_class: Dict[str, EntityClass] = {}
+    vulnerability_mask = 0
+
+    def __new__(cls, cls_name: str, bases: tuple, attributes: dict) -> EntityClass:
+        attributes.setdefault("__slots__", ())
+        return super().__new__(cls, cls_name, bases, attributes)
 
     def __init__(cls, cls_name: str, bases: tuple, attributes: dict) -> None:
         super().__init__(cls_name, bases, attributes)
@@ -73,6 +92,10 @@ class EntityClass(type):
                 )
             type(cls).representation_to_entity_class[cls.REPR] = cls
 
+        cls.vulnerability_mask = 0
+        for type_ in cls.VULNERABILITIES:
+            cls.vulnerability_mask |= 1 << type_.value
+
 
 class Entity(observable.Observable, metaclass=EntityClass):
     """Anything that is inside the maze.
@@ -92,6 +115,18 @@ class Entity(observable.Observable, metaclass=EntityClass):
         SCORE_ON_REMOVE (Bool): Create the reward on remove rather than on removing
     """
 
+    __slots__ = (
+        "maze",
+        "_position",
+        "health",
+        "_size",
+        "_rect_offset",
+        "removing_timer",
+        "removing_event",
+        "colliding_rect",
+        "score_collectors",
+    )
+
     REPR: str = ""
     BASE_HEALTH = 0
     SIZE = (1.0, 1.0)
@@ -99,6 +134,7 @@ class Entity(observable.Observable, metaclass=EntityClass):
     REMOVING_DELAY: float = 0
     SCORE = Score.S0
     SCORE_ON_REMOVE = False
+    vulnerability_mask = 0  # Built by the metaclass from VULNERABILITIES
 
     def __init__(self, maze_: maze.Maze, position: vector.Vector) -> None:
         """Initialise an entity in the maze.
@@ -113,8 +149,10 @@ class Entity(observable.Observable, metaclass=EntityClass):
         self._position = position
         self.health = self.BASE_HEALTH
         self._size = vector.Vector(self.SIZE)
-        self.removing_timer = timer.Timer(increase=False)
-        self.colliding_rect: vector.Rect = self._build_colliding_rect(self.position, self.size)
+        self._rect_offset = self._build_rect_offset(self._size)
+        self.removing_timer: timer.Timer = NOT_REMOVING  # A real timer is only built when removing
+        self.removing_event: events.RemovingEntityEvent  # Sent at each update while removing: built with the timer
+        self.colliding_rect: vector.Rect = self._build_colliding_rect(self.position)
         self.score_collectors: Set[Player] = set()
 
     @property
@@ -124,7 +162,8 @@ class Entity(observable.Observable, metaclass=EntityClass):
     @position.setter
     def position(self, position: vector.Vector) -> None:
         self._position = position
-        self.colliding_rect = self._build_colliding_rect(self._position, self._size)
+        self.colliding_rect = self._build_colliding_rect(position)
+        self.maze.reindex(self)
 
     @property
     def size(self) -> vector.Vector:
@@ -133,20 +172,37 @@ class Entity(observable.Observable, metaclass=EntityClass):
     @size.setter
     def size(self, size: vector.Vector) -> None:
         self._size = size
-        self.colliding_rect = self._build_colliding_rect(self._position, self._size)
+        self._rect_offset = self._build_rect_offset(size)
+        self.colliding_rect = self._build_colliding_rect(self._position)
+        self.maze.reindex(self)
 
     @staticmethod
-    def _build_colliding_rect(position: vector.Vector, size: vector.Vector) -> vector.Rect:
-        """Build the colliding rect of the entity
+    def _build_rect_offset(size: vector.Vector) -> Optional[vector.Vector]:
+        """Offset between the position and the colliding rect for a given size
 
         Given the current approach, the image size is a tuple of integer.
         Entity with a float size have an int size image centered on the entity.
         And the position of the entity is the top left position of the image.
 
+        Returns:
+            Optional[vector.Vector]: The offset, None for integer sizes (No offset)
+        """
+        # Plain float arithmetic: lasers are resized (and rebuild their offset) at each frame
+        offset_i = (math.ceil(size[0]) - size[0]) * 0.5
+        offset_j = (math.ceil(size[1]) - size[1]) * 0.5
+        if offset_i or offset_j:
+            return vector.Vector((offset_i, offset_j))
+        return None
+
+    def _build_colliding_rect(self, position: vector.Vector) -> vector.Rect:
+        """Build the colliding rect of the entity at a given position (with its current size)
+
         Returns:
             vector.Rect: The colliding rect of the entity
         """
-        return vector.Rect(position + (size.apply(math.ceil) - size) * 0.5, size)
+        if self._rect_offset is None:
+            return vector.Rect(position, self._size)
+        return vector.Rect(position + self._rect_offset, self._size)
 
     def update(self, delay: float) -> None:
         """Handle time forwarding.
@@ -158,13 +214,11 @@ class Entity(observable.Observable, metaclass=EntityClass):
             if self.removing_timer.update(delay):
                 self.remove()
             else:
-                self.changed(events.RemovingEntityEvent(self))
+                self.changed(self.removing_event)
 
     def hit(self, damage: Damage) -> bool:
-        if self.removing_timer.is_active:
-            return False
-
-        if damage.type not in self.VULNERABILITIES:
+        # Single early exit, cheapest test first (most hits are on invulnerable entities)
+        if not self.vulnerability_mask & damage.type_bit or self.removing_timer.is_active:
             return False
 
         if isinstance(damage.entity, Laser):
@@ -188,8 +242,16 @@ class Entity(observable.Observable, metaclass=EntityClass):
         # Note: Sent to the maze view, not the entity view
         self.maze.changed(events.ScoreEvent(self))
 
-    def removing(self) -> None:
+    def _start_removing_timer(self) -> None:
+        """Start the removing timer (Built with its event at the first call, then kept)"""
+        if self.removing_timer is NOT_REMOVING:
+            self.removing_timer = timer.Timer(increase=False)
+            self.removing_event = events.RemovingEntityEvent(self)
         self.removing_timer.start(self.REMOVING_DELAY)
+
+    def removing(self) -> None:
+        self._start_removing_timer()
+        self.maze.wake_up(self)  # Static entities are only updated while removing
         self.changed(events.StartRemovingEvent(self))
 
         if not self.SCORE_ON_REMOVE:
@@ -214,7 +276,7 @@ class Coin(Entity):
         super().update(delay)
 
         if not self.removing_timer.is_active:
-            players = self.maze.get_collision(self.colliding_rect, lambda entity: isinstance(entity, Player))
+            players = self.maze.get_collision_of(self.colliding_rect, (Player,))
             if players:
                 self.score_collectors = cast(Set[Player], players)
                 self.removing()
@@ -229,8 +291,7 @@ class BreakableWall(Entity):
     def remove(self) -> None:
         rand = random.random()
         if rand <= BonusClass.BONUS_RATE:
-            weights = list(map(lambda klass: klass.RATE, BonusClass.bonus_classes))
-            klass = random.choices(BonusClass.bonus_classes, weights=weights, k=1)[0]
+            klass = random.choices(BonusClass.bonus_classes, cum_weights=BonusClass.bonus_cum_weights, k=1)[0]
             self.maze.add_entity(klass(self.maze, self.position))
         super().remove()
 
@@ -242,10 +303,12 @@ class SolidWall(Entity):
 class BreakableWallRemover(Entity):
     """Fake entity that removes walls when a LightBoltBonus is caught"""
 
+    __slots__ = ("sorted_walls", "removed")
+
     def __init__(self, maze_: maze.Maze, position: vector.Vector) -> None:
         super().__init__(maze_, position)
         self.sorted_walls = sorted(
-            filter(lambda entity: isinstance(entity, BreakableWall), self.maze.entities),
+            cast(Set[BreakableWall], self.maze.get_entities(BreakableWall)),
             key=lambda wall: sum(wall.position),
         )
 
@@ -270,6 +333,8 @@ class BreakableWallRemover(Entity):
 
 
 class Bomb(Entity):
+    __slots__ = ("player", "radius", "timer", "forward_event")
+
     VULNERABILITIES = [Damage.Type.BOMBS]
     REMOVING_DELAY = 0.0
     BASE_TIMEOUT = 5.0
@@ -281,6 +346,7 @@ class Bomb(Entity):
         self.radius = player.bomb_radius
         self.timer = timer.Timer(increase=False)
         self.timer.start(self.FAST_TIMEOUT if player.fast_bomb else self.BASE_TIMEOUT)
+        self.forward_event = events.ForwardTimeEvent(0.0)  # Sent at each update: built once
 
     def update(self, delay: float) -> None:
         if self.removing_timer.is_active:
@@ -292,7 +358,8 @@ class Bomb(Entity):
             super().update(-self.timer.current)
             return
 
-        self.changed(events.ForwardTimeEvent(delay))
+        self.forward_event.delay = delay
+        self.changed(self.forward_event)
 
     def removing(self) -> None:
         super().removing()
@@ -301,9 +368,24 @@ class Bomb(Entity):
         Laser.generate_from_bomb(self)
 
 
+@functools.lru_cache(maxsize=None)
+def laser_strengths(radius: int) -> Tuple[float, ...]:
+    """Strength of the lasers of a bomb at each distance (The furthest the weakest)
+
+    Args:
+        radius (int): Radius of the bomb
+
+    Returns:
+        Tuple[float, ...]: Strength of the laser for each distance in [0, radius]
+    """
+    return (1.0,) + tuple(0.5 * (dist / radius) + (1 - dist / radius) for dist in range(1, radius + 1))
+
+
 class Laser(Entity):
     """Laser entity created by a Bomb explosion"""
 
+    __slots__ = ("player", "orientation", "size_mask", "hit_damage")
+
     class Orientation(enum.Enum):
         CENTER = 0
         VERTICAL = 1
@@ -313,17 +395,33 @@ class Laser(Entity):
     DAMAGE = 13
     USE_STRENGTH = False  # By default lasers are all the same strength
 
+    # For each orientation, which dimensions follow the laser size (1.0) or stay full (0.0)
+    SIZE_MASKS = {
+        Orientation.CENTER: (1.0, 1.0),
+        Orientation.VERTICAL: (0.0, 1.0),
+        Orientation.HORIZONTAL: (1.0, 0.0),
+    }
+
+    # Directions of the lasers around an exploding bomb, with their orientation
+    BOMB_DIRECTIONS = (
+        (vector.Direction.UP, Orientation.VERTICAL),
+        (vector.Direction.DOWN, Orientation.VERTICAL),
+        (vector.Direction.RIGHT, Orientation.HORIZONTAL),
+        (vector.Direction.LEFT, Orientation.HORIZONTAL),
+    )
+
     def __init__(
         self, player: Player, position: vector.Vector, strength: float, orientation: Laser.Orientation
     ) -> None:
         super().__init__(player.maze, position)
         self.player = player
         self.orientation = orientation
+        self.size_mask = self.SIZE_MASKS[orientation]
 
         if not self.USE_STRENGTH:
             strength = 1.0
 
-        self.damage = int(self.DAMAGE * strength)
+        self.hit_damage = Damage(self, int(self.DAMAGE * strength), Damage.Type.BOMBS)
         self.removing()
 
     def update(self, delay: float) -> None:
@@ -335,15 +433,11 @@ class Laser(Entity):
         decay = abs(self.removing_timer.current - self.REMOVING_DELAY / 2)
         size = 1 - 2 / self.REMOVING_DELAY * decay
 
-        if self.orientation == Laser.Orientation.CENTER:
-            self.size = vector.Vector((size, size))
-        elif self.orientation == Laser.Orientation.HORIZONTAL:
-            self.size = vector.Vector((size, 1.0))
-        else:  # Vertical
-            self.size = vector.Vector((1.0, size))
+        mask_i, mask_j = self.size_mask
+        self.size = vector.Vector((size * mask_i + (1.0 - mask_i), size * mask_j + (1.0 - mask_j)))
 
         for entity in self.maze.get_collision(self.colliding_rect):
-            entity.hit(Damage(self, self.damage, Damage.Type.BOMBS))
+            entity.hit(self.hit_damage)
 
     @staticmethod
     def generate_from_bomb(bomb: Bomb) -> None:
@@ -354,27 +448,24 @@ class Laser(Entity):
         """
         maze_ = bomb.maze
         maze_.add_entity(Laser(bomb.player, bomb.position, 1, Laser.Orientation.CENTER))
+        i, j = int(bomb.position[0]), int(bomb.position[1])  # Int position
+        strengths = laser_strengths(bomb.radius)
 
-        for direction in [vector.Direction.UP, vector.Direction.DOWN, vector.Direction.RIGHT, vector.Direction.LEFT]:
+        for direction, orientation in Laser.BOMB_DIRECTIONS:
             position = bomb.position
-            if direction in {vector.Direction.UP, vector.Direction.DOWN}:
-                orientation = Laser.Orientation.VERTICAL
-            else:
-                orientation = Laser.Orientation.HORIZONTAL
+            step_vector = direction.vector  # pylint: disable=no-member
+            d_i, d_j = int(step_vector[0]), int(step_vector[1])
             for dist in range(1, bomb.radius + 1):
-                position += direction.vector  # Int position  # pylint: disable=no-member
-                laser_rect = vector.Rect(position, bomb.size)
+                position += step_vector
+                tile = maze_.get_tile(i + dist * d_i, j + dist * d_j)
 
-                if not maze_.is_inside(laser_rect) or maze_.get_collision(
-                    laser_rect, lambda entity: isinstance(entity, SolidWall)
-                ):
+                if tile is None or tile == maze.Maze.Tile.SOLID:
                     # Stop generating laser for this direction we have reached a solid wall
                     break
 
-                alpha = dist / bomb.radius
-                strength = 0.5 * alpha + (1 - alpha)  # The furthest the weakest
+                strength = strengths[dist]
 
-                if maze_.get_collision(laser_rect, lambda entity: isinstance(entity, BreakableWall)):
+                if tile == maze.Maze.Tile.BREAKABLE:
                     # Lasers can go through breakable wall only if the bomb is close to it
                     if dist == 1:
                         maze_.add_entity(Laser(bomb.player, position, strength, orientation))
@@ -395,6 +486,17 @@ class MovingEntity(Entity):
         BOUNCE_ON (Set[EntityClass]): Moving entities that will block the entity.
     """
 
+    __slots__ = (
+        "speed",
+        "current_direction",
+        "next_direction",
+        "prev_position",
+        "next_position",
+        "try_moving_since",
+        "is_still_since",
+        "step",
+    )
+
     BASE_SPEED = 4.0
     BLOCKED_BY: Tuple[EntityClass, ...] = (SolidWall, BreakableWall)
     BOUNCE_ON: Tuple[EntityClass, ...] = ()
@@ -452,7 +554,7 @@ class MovingEntity(Entity):
             self._update_direction()
             if not self.current_direction and self.try_moving_since:
                 self.try_moving_since = 0
-                self.changed(events.MovedEntityEvent(self))  # Stop trying to move against an obstacle
+                self.maze.moved_entities.add(self)  # Stop trying to move against an obstacle
 
         if not self.current_direction:  # No direction, nothing to do
             return
@@ -468,14 +570,13 @@ class MovingEntity(Entity):
         if not self.next_position:  # Move against an obstacle
             if self.is_still_since > 1:
                 self.teleport()  # On a teleporter, don't stay blocked
-            self.changed(events.MovedEntityEvent(self))
+            self.maze.moved_entities.add(self)
             return
 
         self.is_still_since = 0.0
         step = delay * self.speed
-        self.position += self.current_direction.vector * step
         self.step += step
-        if self.step >= 1:  # Has reached a new tile
+        if self.step >= 1:  # Has reached a new tile (No need to go through the intermediate position)
             if self.speed == 0:
                 remaining_delay = 0.0
             else:
@@ -491,29 +592,31 @@ class MovingEntity(Entity):
             self.move(remaining_delay)
             return
 
+        # The position is always rebuilt from the tile and the step: no drift is accumulated between tiles
+        # (Computed on floats: a single vector is built per frame)
+        position = self.position
+        prev_i, prev_j = self.prev_position
+        d_i, d_j = self.current_direction.vector
+        self.position = vector.Vector((prev_i + d_i * self.step, prev_j + d_j * self.step))
+
         # Collision (Should almost never occurs with step=1, let's see if it is enough)
-        colliding_entities = self.maze.get_collision(
-            self.colliding_rect, lambda entity: isinstance(entity, self.BOUNCE_ON) and entity is not self
-        )
+        colliding_entities = self.maze.get_collision_of(self.colliding_rect, self.BOUNCE_ON, self)
         if len(colliding_entities) > 1:
             print("WARNING: More than one entites colliding at once")
 
         if colliding_entities:
-            self.position -= self.current_direction.vector * step
+            self.position = position
             self.step -= step
             if self.next_direction != self.current_direction:  # Stop insisting
                 self._switch_direction()
 
-        self.changed(events.MovedEntityEvent(self))
+        self.maze.moved_entities.add(self)
 
     def teleport(self) -> bool:
         """Try to teleport the entity"""
         assert self.position.int_part() == self.position
 
-        for teleporter in self.maze.entities:
-            if not isinstance(teleporter, Teleporter):
-                continue
-
+        for teleporter in cast(Set[Teleporter], self.maze.get_entities(Teleporter)):
             if not teleporter.position == self.position:
                 continue
 
@@ -544,24 +647,31 @@ class MovingEntity(Entity):
         - There is no blocking entities on the path
         - The entity won't bonce immediately
         """
-        next_position = self.position + next_direction.vector
-        rect = self._build_colliding_rect(next_position, self.size)
-
-        valid = self.maze.is_inside(rect)
-        valid = valid and not self.maze.get_collision(rect, lambda entity: isinstance(entity, self.BLOCKED_BY))
+        d_i, d_j = next_direction.vector
+        position_i, position_j = self._position
+        i = position_i + d_i
+        j = position_j + d_j
+
+        on_tile = self._size == (1.0, 1.0) and i.is_integer() and j.is_integer()
+        if on_tile and self.BLOCKED_BY == MovingEntity.BLOCKED_BY:  # Only walls on a single tile: use the tile map
+            valid = self.maze.is_free(int(i), int(j))
+        else:
+            rect = self._build_colliding_rect(vector.Vector((i, j)))
+            valid = self.maze.is_inside(rect)
+            valid = valid and not self.maze.get_collision_of(rect, self.BLOCKED_BY)
 
-        next_position = self.position + 0.1 * next_direction.vector
-        rect = self._build_colliding_rect(next_position, self.size)
-        valid = valid and not self.maze.get_collision(
-            rect, lambda entity: isinstance(entity, self.BOUNCE_ON) and entity != self
-        )
+        if not valid:  # Do not even build the bounce rect
+            return False
 
-        return valid
+        rect = self._build_colliding_rect(vector.Vector((position_i + 0.1 * d_i, position_j + 0.1 * d_j)))
+        return not self.maze.get_collision_of(rect, self.BOUNCE_ON, self)
 
 
 class Teleporter(Entity):
     """Teleports moving entities in the maze"""
 
+    __slots__ = ("reload_timer", "alive_since", "_next_teleporter", "_in_next_teleporter", "forward_event")
+
     REPR = "T"
     RELOADING_DELAY = 0.8  # When reloading, nothing can go out of it (But you can still go in)
     BLOCKED_BY = (MovingEntity,)
@@ -574,6 +684,7 @@ class Teleporter(Entity):
 
         self.alive_since = timer.Timer()
         self.alive_since.start(100)
+        self.forward_event = events.ForwardTimeEvent(0.0)  # Sent at each update: built once
 
     @property
     def next_teleporter(self) -> Optional[Teleporter]:
@@ -602,7 +713,7 @@ class Teleporter(Entity):
         if self.reload_timer.is_active:
             return False
 
-        if self.maze.get_collision(self.colliding_rect, lambda entity: isinstance(entity, self.BLOCKED_BY)):
+        if self.maze.get_collision_of(self.colliding_rect, self.BLOCKED_BY):
             return False
 
         return True
@@ -612,14 +723,16 @@ class Teleporter(Entity):
 
         if not self.reload_timer.is_active:
             self.alive_since.update(delay)
-            self.changed(events.ForwardTimeEvent(delay))
+            self.forward_event.delay = delay
+            self.changed(self.forward_event)
             return
 
         if self.reload_timer.update(delay):
             delay = -self.reload_timer.current
             self.reload_timer.reset()
             self.alive_since.update(delay)
-            self.changed(events.ForwardTimeEvent(delay))
+            self.forward_event.delay = delay
+            self.changed(self.forward_event)
 
     def teleport(self):
         self.maze.add_entity(Flash(self.maze, self.position))
@@ -634,7 +747,7 @@ class Flash(Entity):
 
     def __init__(self, maze_: maze.Maze, position: vector.Vector) -> None:
         super().__init__(maze_, position)
-        self.removing_timer.start(self.REMOVING_DELAY)
+        self._start_removing_timer()
 
 
 # TODO: Handle success image and sound
@@ -660,6 +773,20 @@ class Player(MovingEntity):  # pylint: disable=too-many-instance-attributes
         score (int): Current score of the player
     """
 
+    __slots__ = (
+        "identifier",
+        "bomb_capacity",
+        "bomb_radius",
+        "fast_bomb",
+        "fast",
+        "shield",
+        "life",
+        "bomb_timer",
+        "bomb_count",
+        "score",
+        "extra",
+    )
+
     # Has no real REPR. X and Y are used to indicates that a player can spawn here.
     # Players are added to a maze by the game itself
 
@@ -743,26 +870,32 @@ class Player(MovingEntity):  # pylint: disable=too-many-instance-attributes
         self.position = position
         self.reset()
 
-    def bombs(self) -> None:
+    def can_bomb(self) -> bool:
+        """Cheap checks on the player state before trying to drop a bomb
+
+        Does not check whether a bomb is already at the dropping position (See `bombs`).
+        """
         if self.removing_timer.is_active:
-            return
+            return False
 
         if self.bomb_count == self.bomb_capacity:
-            return
+            return False
 
         if self.bomb_timer.is_active:
-            return
+            return False
+
+        return not 0.6 < self.step < 0.8
 
-        if 0.6 < self.step < 0.8:
+    def bombs(self) -> None:
+        if not self.can_bomb():
             return
 
         bomb_position = self.prev_position
         if self.next_position and self.step >= 0.8:
             bomb_position = self.next_position
 
-        if self.maze.get_collision(
-            self._build_colliding_rect(bomb_position, self.size), lambda entity: isinstance(entity, Bomb)
-        ):  # Don't drop a bomb if one is already here
+        bomb_rect = self._build_colliding_rect(bomb_position)
+        if self.maze.get_collision_of(bomb_rect, (Bomb,)):  # Don't drop a bomb if one is already here
             return
 
         self.maze.add_entity(Bomb(self, bomb_position))
@@ -798,7 +931,17 @@ class Player(MovingEntity):  # pylint: disable=too-many-instance-attributes
         return True
 
     def update(self, delay: float) -> None:
-        super().update(delay)
+        # Inlined Entity.update and MovingEntity.update (hot path, called each frame)
+        # Note: a player removed here may get a new life and move right away (new_life resets the removing timer)
+        removing_timer = self.removing_timer
+        if removing_timer.is_active:
+            if removing_timer.update(delay):
+                self.remove()
+            else:
+                self.changed(self.removing_event)
+
+        if not removing_timer.is_active:
+            self.move(delay)
 
         if self.shield.update(delay):
             self.shield.reset()
@@ -818,10 +961,24 @@ Player.BOUNCE_ON = (Player,)
 
 # XXX: Build a AI system for enemies rather than this ?
 
+# Directions tried by the enemies (in this order), the bit of the opposite of each direction
+# and the tuple of directions for each mask of valid ones
+# (The k-th bit of the mask is set if the k-th direction is valid)
+ENEMY_DIRECTIONS = (vector.Direction.DOWN, vector.Direction.UP, vector.Direction.LEFT, vector.Direction.RIGHT)
+ENEMY_DIRECTION_BITS = {direction: 1 << k for k, direction in enumerate(ENEMY_DIRECTIONS)}
+OPPOSITE_DIRECTION_BITS = {
+    direction: ENEMY_DIRECTION_BITS[vector.OPPOSITE_DIRECTIONS[direction]] for direction in ENEMY_DIRECTIONS
+}
+DIRECTIONS_BY_MASK = tuple(
+    tuple(direction for k, direction in enumerate(ENEMY_DIRECTIONS) if mask >> k & 1) for mask in range(16)
+)
+
 
 class Enemy(MovingEntity):
     """Base class for all enemies."""
 
+    __slots__ = ("reload_timer", "firing_timer", "noise_timer", "fast", "is_alien", "hit_damage")
+
     REMOVING_DELAY = 2.0
     BASE_SPEED = 2.0
     VULNERABILITIES = [Damage.Type.BOMBS]
@@ -842,16 +999,19 @@ class Enemy(MovingEntity):
         self.noise_timer.start(random.uniform(self.MIN_YELL_DELAY, self.MAX_YELL_DELAY))
         self.fast = False
         self.is_alien = False
+        self.hit_damage = Damage(self, self.DAMAGE, Damage.Type.ENEMIES)
 
     def _update_direction(self) -> None:
-        plausible_directions = []
-        for direction in [vector.Direction.DOWN, vector.Direction.UP, vector.Direction.LEFT, vector.Direction.RIGHT]:
+        mask = 0
+        for k, direction in enumerate(ENEMY_DIRECTIONS):  # Bit k <=> direction k (no lookup by enum member)
             if self._valid_next_direction(direction):
-                plausible_directions.append(direction)
+                mask |= 1 << k
 
-        if not plausible_directions:
+        if not mask:
             return
 
+        plausible_directions = DIRECTIONS_BY_MASK[mask]
+
         if self.CHASE:
             best_direction = None
             best_distance = None
@@ -866,16 +1026,18 @@ class Enemy(MovingEntity):
                 self.current_direction = best_direction
                 return
 
-        opposite_direction: Optional[vector.Direction]
-        if self.current_direction:
-            opposite_direction = vector.Direction.get_opposite_direction(self.current_direction)
-        else:
-            opposite_direction = None
-
-        if not self.ERRATIC and opposite_direction in plausible_directions and len(plausible_directions) > 1:
-            plausible_directions.remove(opposite_direction)
+        if not self.ERRATIC and self.current_direction:
+            opposite_bit = OPPOSITE_DIRECTION_BITS[self.current_direction]
+            if mask & opposite_bit and mask != opposite_bit:  # Don't go back if there is another way
+                mask ^= opposite_bit
 
-        self.current_direction = random.choice(plausible_directions)
+        # Uniform pick of a valid direction: draw 2 random bits until they select a bit of the mask
+        # (Cheaper than random.choice which goes through several python calls)
+        getrandbits = random.getrandbits
+        index = getrandbits(2)
+        while not mask >> index & 1:
+            index = getrandbits(2)
+        self.current_direction = ENEMY_DIRECTIONS[index]
 
     def enraged(self) -> None:
         """Called when the time is up.
@@ -896,13 +1058,19 @@ class Enemy(MovingEntity):
         self.speed = self.BASE_SPEED
 
     def update(self, delay: float) -> None:
-        if self.fast and not self.removing_timer.is_active:
-            delay *= 2  # Twice faster for everything
+        # Inlined Entity.update and MovingEntity.update (hot path, called each frame)
+        removing_timer = self.removing_timer
+        if removing_timer.is_active:
+            if removing_timer.update(delay):
+                self.remove()
+            else:
+                self.changed(self.removing_event)
+            return
 
-        super().update(delay)
+        if self.fast:
+            delay *= 2  # Twice faster for everything
 
-        if self.removing_timer.is_active:
-            return
+        self.move(delay)
 
         if self.noise_timer.update(delay):
             self.yell()
@@ -915,7 +1083,7 @@ class Enemy(MovingEntity):
             self.reload_timer.reset()
 
         for entity in self.maze.get_collision(self.colliding_rect):
-            entity.hit(Damage(self, self.DAMAGE, Damage.Type.ENEMIES))  # Hit itself but fine
+            entity.hit(self.hit_damage)  # Hit itself but fine
 
         if self.is_alien:  # Alien cannot attack
             return
@@ -934,23 +1102,28 @@ class Enemy(MovingEntity):
         Returns:
             Optional[float]: Distance of the player or None if no player is found
         """
+        players = [player for player in self.maze.get_entities(Player) if not player.removing_timer.is_active]
+        if not players:
+            return None
+
         distance = -1.0
         player = None
-        size = vector.Vector((1.0, 1.0))
+        size = vector.Vector((1.0, 1.0))  # Integer size: the rect starts at the position
         position = self.position
-        rect = self._build_colliding_rect(position, size)
+        direction_vector = direction.vector
+        rect = vector.Rect(position, size)
         while not player and self.maze.is_inside(rect):
             distance += 1
-            for entity in self.maze.get_collision(rect):
-                if isinstance(entity, Player):
-                    if not entity.removing_timer.is_active:
-                        player = entity
-                        break
-                if isinstance(entity, (SolidWall, BreakableWall)):
+            for candidate in players:
+                if rect.collide_with(candidate.colliding_rect):
+                    player = candidate
+                    break
+            else:
+                if self.maze.has_wall(rect):
                     return None
 
-            position += direction.vector
-            rect = self._build_colliding_rect(position, size)
+            position += direction_vector
+            rect = vector.Rect(position, size)
 
         if not player:
             return None
@@ -960,7 +1133,7 @@ class Enemy(MovingEntity):
 
         # When the distance is 0, we have to be more precise
         true_direction = player.position - self.position  # Direction to follow to match the player position
-        distance = -sum(true_direction * direction.vector)  # < 0 if the direction match
+        distance = -sum(true_direction * direction_vector)  # < 0 if the direction match
 
         return distance
 
@@ -1153,6 +1326,8 @@ class Head(Enemy):
     Very specific enemy that does not move.
     """
 
+    __slots__ = ("left_eye_position", "right_eye_position", "hit_by")
+
     # TODO: Explosion
     REPR = "H"
     SIZE = (3.0, 3.0)
@@ -1200,7 +1375,7 @@ class Head(Enemy):
             delay *= 2
 
         for entity in self.maze.get_collision(self.colliding_rect):  # From Enemy
-            entity.hit(Damage(self, self.DAMAGE, Damage.Type.ENEMIES))  # Hit itself but fine
+            entity.hit(self.hit_damage)  # Hit itself but fine
 
         if self.firing_timer.update(delay):
             self.attack(0.0)
@@ -1225,11 +1400,7 @@ class Head(Enemy):
     def attack(self, distance: float) -> None:
         assert self.BULLET_CLASS
 
-        players = list(
-            filter(
-                lambda entity: isinstance(entity, Player) and not entity.removing_timer.is_active, self.maze.entities
-            )
-        )
+        players = [player for player in self.maze.get_entities(Player) if not player.removing_timer.is_active]
 
         if not players:
             return
@@ -1250,6 +1421,17 @@ class Bullet(Entity):
     Bullets can have non standard direction (like Boss bullets)
     """
 
+    __slots__ = (
+        "enemy",
+        "display_direction",
+        "direction",
+        "speed",
+        "initial_position",
+        "blocked",
+        "distance",
+        "hit_damage",
+    )
+
     REMOVING_DELAY = 0.25
     BASE_SPEED = 5.0
     BLOCKED_BY: Tuple[EntityClass, ...] = (SolidWall, BreakableWall, Enemy, Player)
@@ -1264,22 +1446,24 @@ class Bullet(Entity):
         self.position += direction * 0.5
         self.speed = self.BASE_SPEED
         self.initial_position = self.enemy.position
-        self.distance = 0.0
+        self.distance = 0.0  # Only tracked for bullets with a limited RANGE
         self.blocked = False
+        self.hit_damage = Damage(self, self.DAMAGE, Damage.Type.ENEMIES)
 
     def update(self, delay: float) -> None:
         super().update(delay)
 
-        if not self.blocked:
+        if not self.blocked:  # Once blocked, the bullet does not move anymore
             self.position += self.speed * delay * self.direction
 
-        if not self.maze.is_inside(self.colliding_rect):
-            self.blocked = True
+            if not self.maze.is_inside(self.colliding_rect):
+                self.blocked = True
 
-        diff = self.position - self.initial_position
-        self.distance = math.sqrt(sum(diff * diff))
-        if self.distance > self.RANGE:
-            self.blocked = True
+            if self.RANGE != float("inf"):  # Only bullets with a limited range need their distance
+                diff = self.position - self.initial_position
+                self.distance = math.sqrt(diff[0] * diff[0] + diff[1] * diff[1])
+                if self.distance > self.RANGE:
+                    self.blocked = True
 
         # Check collision
         colliding_entities = self.maze.get_collision(self.colliding_rect)
@@ -1287,9 +1471,9 @@ class Bullet(Entity):
         for entity in colliding_entities:
             if isinstance(entity, self.BLOCKED_BY) and entity != self.enemy:
                 self.blocked = True
-            entity.hit(Damage(self, self.DAMAGE, Damage.Type.ENEMIES))
+            entity.hit(self.hit_damage)
 
-        self.changed(events.MovedEntityEvent(self))
+        self.maze.moved_entities.add(self)
 
         if self.blocked and not self.removing_timer.is_active:
             self.removing()
@@ -1374,6 +1558,8 @@ Giggler.BULLET_CLASS = Magma
 
 
 class Missile(Bullet):
+    __slots__ = ("alive_since",)
+
     BLOCKED_BY = (Enemy, Player)
     BASE_SPEED = 3.5
     DAMAGE = 4
@@ -1395,6 +1581,7 @@ Head.BULLET_CLASS = Missile
 
 class BonusClass(EntityClass):
     bonus_classes: List[BonusClass] = []
+    bonus_cum_weights: List[float] = []  # Cumulated RATE of the bonus classes (To draw a bonus class)
     BONUS_RATE = 0.1
     RATE = 0.0
 
@@ -1402,11 +1589,14 @@ class BonusClass(EntityClass):
         super().__init__(cls_name, bases, attributes)
 
         type(cls).bonus_classes.append(cls)
+        type(cls).bonus_cum_weights.append(sum(klass.RATE for klass in type(cls).bonus_classes))
 
 
 class Bonus(Entity, metaclass=BonusClass):
     """Base class for Bonus"""
 
+    __slots__ = ("timer",)
+
     RATE = 0.0
     DELAY = 7.0
     REMOVING_DELAY = 3.0
@@ -1431,7 +1621,7 @@ class Bonus(Entity, metaclass=BonusClass):
             self.timer.reset()
             self.removing()
 
-        players = self.maze.get_collision(self.colliding_rect, lambda entity: isinstance(entity, Player))
+        players = self.maze.get_collision_of(self.colliding_rect, (Player,))
         if players:
             self.catch(cast(Player, players.pop()))
 
@@ -1455,11 +1645,10 @@ class SkullBonus(Bonus):
 
     def catch(self, player: Player) -> None:
         super().catch(player)
-        for entity in self.maze.entities:
-            if isinstance(entity, Enemy):
-                if not entity.removing_timer.is_active:
-                    entity.score_collectors.add(player)
-                    entity.removing()
+        for entity in self.maze.get_entities(Enemy):
+            if not entity.removing_timer.is_active:
+                entity.score_collectors.add(player)
+                entity.removing()
 
 
 class BombCapacityBonus(Bonus):
@@ -1554,6 +1743,8 @@ class FastBonus(Bonus):
 class ExtraLetter(Entity):
     """Extra Letter dropped by aliens"""
 
+    __slots__ = ("letter_id", "letter_timer", "forward_event")
+
     LETTER_DELAY = 2.0
     SCORE = Score.S100
     SCORE_ON_REMOVE = True
@@ -1563,6 +1754,7 @@ class ExtraLetter(Entity):
         self.letter_id = random.randint(0, 4)  # 0 = E, 4 = A
         self.letter_timer = timer.Timer(increase=False)
         self.letter_timer.start(self.LETTER_DELAY)
+        self.forward_event = events.ForwardTimeEvent(0.0)  # Sent at each update: built once
 
     def catch(self, player: Player) -> None:
         self.changed(events.NoiseEvent(self))
@@ -1573,7 +1765,7 @@ class ExtraLetter(Entity):
     def update(self, delay: float) -> None:
         super().update(delay)
 
-        players = self.maze.get_collision(self.colliding_rect, lambda entity: isinstance(entity, Player))
+        players = self.maze.get_collision_of(self.colliding_rect, (Player,))
         if players:
             self.catch(cast(Player, players.pop()))
             return
@@ -1583,4 +1775,5 @@ class ExtraLetter(Entity):
             self.letter_id = (self.letter_id + 1) % 5
             self.letter_timer.start(self.LETTER_DELAY)
 
-        self.changed(events.ForwardTimeEvent(delay))
+        self.forward_event.delay = delay
+        self.changed(self.forward_event)
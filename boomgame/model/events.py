@@ -9,100 +9,134 @@ from . import entity
 class MazeStartEvent(Event):
     """At each new maze"""
 
+    __slots__ = ()
+
 
 class MazeEndEvent(Event):
     """When a maze is released"""
 
+    __slots__ = ()
+
 
 class GameEndEvent(Event):
     """When the game is done"""
 
+    __slots__ = ()
+
 
 class StartScreenEvent(Event):
     """At the beginning of each start screen"""
 
+    __slots__ = ()
+
 
 class ForwardStartScreenEvent(Event):
     "Could be used to update the start scren"
 
+    __slots__ = ()
+
 
 class BonusScreenEvent(Event):
     """At the begining of each bonus screen"""
 
+    __slots__ = ()
+
 
 class ForwardBonusScreenEvent(Event):
     """Could be used to update the bonus screen (animation ?)"""
 
+    __slots__ = ()
+
 
 class MazeFailedEvent(Event):
     """When the maze is detected as failed"""
 
+    __slots__ = ()
+
 
 class MazeSolvedEvent(Event):
     """When the maze is detected as solved"""
 
+    __slots__ = ()
+
 
 class MazeEndingEvent(Event):
     """Each update of the maze, when it is ending"""
 
+    __slots__ = ()
+
 
 class ExtraGameEvent(Event):
     """At the beginning of the extra game"""
 
+    __slots__ = ()
+
 
 class HurryUpEvent(Event):
     """30s before time's up"""
 
+    __slots__ = ()
+
 
 class ForwardTimeEvent(Event):
     """Notify the view of a progress in time"""
 
+    __slots__ = ("delay",)
+
     def __init__(self, delay: float) -> None:
         super().__init__()
         self.delay = delay
 
 
 class EntityEvent(Event):
+    __slots__ = ("entity",)
+
     def __init__(self, entity_: entity.Entity):
         super().__init__()
         self.entity = entity_
 
 
 class NewEntityEvent(EntityEvent):
-    pass
-
-
-class MovedEntityEvent(EntityEvent):
-    pass
+    __slots__ = ()
 
 
 class HitEntityEvent(EntityEvent):
-    pass
+    __slots__ = ()
 
 
 class RemovingEntityEvent(EntityEvent):
     """Each time the entity is removing"""
 
+    __slots__ = ()
+
 
 class RemovedEntityEvent(EntityEvent):
-    pass
+    __slots__ = ()
 
 
 class LifeLossEvent(EntityEvent):
     """When a player loses a life (after its removing delay)"""
 
+    __slots__ = ()
+
 
 class PlayerDetailsEvent(EntityEvent):
     """When a player details has to be updated"""
 
+    __slots__ = ()
+
 
 class NoiseEvent(EntityEvent):
     """At each entity noise (Not all sounds)"""
 
+    __slots__ = ()
+
 
 class StartRemovingEvent(EntityEvent):
     """when the entity reaches removing state"""
 
+    __slots__ = ()
+
 
 class ScoreEvent(EntityEvent):
     """When score is earned
@@ -110,6 +144,8 @@ class ScoreEvent(EntityEvent):
     Will trigger a score slider (Notify by the entity as a change of the maze)
     """
 
+    __slots__ = ()
+
 
 class ExtraLifeEvent(EntityEvent):
     """When a player completed EXTRA letters
@@ -117,6 +153,8 @@ class ExtraLifeEvent(EntityEvent):
     Will trigger a slider (Notify by the player as a change of the maze)
     """
 
+    __slots__ = ()
+
     def __init__(self, entity_: entity.Entity):
         super().__init__(entity_)
         self.entity: entity.Player
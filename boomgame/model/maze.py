@@ -6,7 +6,9 @@ It holds all the data of current level.
 from __future__ import annotations
 
 import enum
-from typing import Callable, Dict, List, Optional, Set, Tuple
+import functools
+import math
+from typing import cast, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type
 
 from ..designpattern import observable
 from . import entity, events, timer, vector
@@ -24,6 +26,166 @@ class MazeDescriptionError(MazeException):
     pass
 
 
+@functools.lru_cache(maxsize=None)
+def entity_classes(klass: type) -> Tuple[entity.EntityClass, ...]:
+    """Entity classes in the mro of a class. Entities are indexed under each of them.
+
+    Args:
+        klass (type): Class of an entity
+
+    Returns:
+        Tuple[entity.EntityClass, ...]: The class and all its entity parent classes
+    """
+    return tuple(parent for parent in klass.__mro__ if isinstance(parent, entity.EntityClass))
+
+
+@functools.lru_cache(maxsize=None)
+def is_static(klass: Type[entity.Entity]) -> bool:
+    """Static entities keep the default `Entity.update`: they only need to be updated while removing
+
+    Args:
+        klass (Type[entity.Entity]): Class of an entity
+
+    Returns:
+        bool
+    """
+    return klass.update is entity.Entity.update
+
+
+def colliding_entities(rect: vector.Rect, candidates: Iterable[entity.Entity]) -> Set[entity.Entity]:
+    """Keep the candidates whose colliding rect overlaps the given rect
+
+    Same test as `vector.Rect.collide_with`, but the bounds of the rect are computed once
+    for all the candidates (and no method is called for each of them).
+
+    Args:
+        rect (vector.Rect): The rect to look at
+        candidates (Iterable[entity.Entity]): Entities to test
+
+    Returns:
+        Set[entity.Entity]: The candidates in collision with the rect
+    """
+    x_min = rect.x
+    y_min = rect.y
+    x_max = x_min + rect.width
+    y_max = y_min + rect.height
+
+    colliding = set()
+    for entity_ in candidates:
+        other = entity_.colliding_rect
+        if x_min < other.x + other.width and x_max > other.x and y_min < other.y + other.height and y_max > other.y:
+            colliding.add(entity_)
+
+    return colliding
+
+
+class SpatialHashGrid:
+    """Spatial hash of entities by tile (Cells of 1x1)
+
+    Each entity is registered in all the cells its colliding rect overlaps. A rect query then only
+    looks at the entities of the cells it overlaps, instead of all the entities.
+
+    In each cell, the entities are also indexed by class (with all the entity classes of their mro),
+    so that a query can directly look for some kinds of entities.
+
+    Cells are keyed by a flat integer index `i * width + j` (cheaper to hash than a tuple). Out of the maze,
+    distinct cells may share a key: it only adds candidates, that are then filtered by the collision test.
+
+    Attrs:
+        width (int): Number of columns of the maze
+        cells (Dict[int, Dict[entity.EntityClass, Set[entity.Entity]]]): Entities of each cell by class
+        spans (Dict[entity.Entity, Tuple[int, int, int, int]]): Cells (i_min, i_max, j_min, j_max) of each entity
+    """
+
+    def __init__(self, width: int) -> None:
+        self.width = max(1, width)
+        self.cells: Dict[int, Dict[entity.EntityClass, Set[entity.Entity]]] = {}
+        self.spans: Dict[entity.Entity, Tuple[int, int, int, int]] = {}
+
+    @staticmethod
+    def span(rect: vector.Rect) -> Tuple[int, int, int, int]:
+        """Cells overlapped by a rect
+
+        Args:
+            rect (vector.Rect): The rect to look at
+
+        Returns:
+            Tuple[int, int, int, int]: i_min, i_max, j_min, j_max (included)
+        """
+        i_min = math.floor(rect.x)
+        j_min = math.floor(rect.y)
+        return (
+            i_min,
+            max(i_min, math.ceil(rect.x + rect.width) - 1),
+            j_min,
+            max(j_min, math.ceil(rect.y + rect.height) - 1),
+        )
+
+    def insert(self, entity_: entity.Entity) -> None:
+        """Register an entity in the cells it overlaps"""
+        span = self.span(entity_.colliding_rect)
+        self.spans[entity_] = span
+        classes = entity_classes(type(entity_))
+        i_min, i_max, j_min, j_max = span
+        for i in range(i_min, i_max + 1):
+            for j in range(j_min, j_max + 1):
+                buckets = self.cells.setdefault(i * self.width + j, {})
+                for klass in classes:
+                    buckets.setdefault(klass, set()).add(entity_)
+
+    def remove(self, entity_: entity.Entity) -> None:
+        """Unregister an entity"""
+        classes = entity_classes(type(entity_))
+        i_min, i_max, j_min, j_max = self.spans.pop(entity_)
+        for i in range(i_min, i_max + 1):
+            for j in range(j_min, j_max + 1):
+                key = i * self.width + j
+                buckets = self.cells[key]
+                for klass in classes:
+                    bucket = buckets[klass]
+                    bucket.discard(entity_)
+                    if not bucket:
+                        del buckets[klass]
+                if not buckets:
+                    del self.cells[key]
+
+    def update(self, entity_: entity.Entity) -> None:
+        """Update the cells of a registered entity (after a move or a resize)
+
+        Does nothing if the entity is not registered or still overlaps the same cells.
+        """
+        span = self.spans.get(entity_)
+        if span is None or span == self.span(entity_.colliding_rect):
+            return
+
+        self.remove(entity_)
+        self.insert(entity_)
+
+    def query(self, rect: vector.Rect, classes: Tuple[entity.EntityClass, ...]) -> Set[entity.Entity]:
+        """Entities registered in the cells overlapped by the rect (They may not collide with it)
+
+        Args:
+            rect (vector.Rect): The rect to look at
+            classes (Tuple[entity.EntityClass, ...]): Only look for instances of these classes
+
+        Returns:
+            Set[entity.Entity]: Candidates for a collision with the rect
+        """
+        candidates: Set[entity.Entity] = set()
+        i_min, i_max, j_min, j_max = self.span(rect)
+        for i in range(i_min, i_max + 1):
+            for j in range(j_min, j_max + 1):
+                buckets = self.cells.get(i * self.width + j)
+                if not buckets:
+                    continue
+                for klass in classes:
+                    bucket = buckets.get(klass)
+                    if bucket:
+                        candidates.update(bucket)
+
+        return candidates
+
+
 class Maze(observable.Observable):
     """Handle all entities in the maze.
 
@@ -33,6 +195,14 @@ class Maze(observable.Observable):
         size (Tuple[int, int]): Number of boxes of the maze. (row, columns)
         state (Maze.State): Current state of the maze.
         entities (List[Entity]): All the entity in the maze.
+        updated_entities (Set[entity.Entity]): Entities to update at each frame. Static entities (See `is_static`)
+            are only updated while removing.
+        moved_entities (Set[entity.Entity]): Entities that have moved since the last display. Filled by the
+            entities, pulled and cleared by the view (Rather than an event at each move).
+        grid (SpatialHashGrid): Spatial hash of the entities used by `get_collision`
+        entities_by_class (Dict[entity.EntityClass, Set[entity.Entity]]): Entities indexed by class
+            (with all the entity classes of their mro). See `get_entities`.
+        tile_map (List[List[Maze.Tile]]): Walls of the maze for each tile (row, column)
         player_spawns (Dict[int, entity.Position]): Spawn position for each player
         end_timer (timer.Timer): Timer of the end of the maze
         extra_game_timer (timer.Timer): Timer for the extra game
@@ -44,6 +214,13 @@ class Maze(observable.Observable):
         FAILED = 1
         SOLVED = 2
 
+    class Tile(enum.IntEnum):
+        """Content of a tile in `tile_map`"""
+
+        FREE = 0
+        SOLID = 1  # SolidWall
+        BREAKABLE = 2  # BreakableWall
+
     SEP = "|"
     VOID = " "
     PLAYER_SPAWNS = {"X": 1, "Y": 2}
@@ -51,16 +228,24 @@ class Maze(observable.Observable):
     GAME_OVER_DELAY = 4.0
     EXTRA_GAME_DELAY = 30.0
     HURRY_UP_DELAY = 30.0
+    BRUTE_FORCE_LIMIT = 32  # Below this number of entities, `get_collision` does not use the grid
 
     def __init__(self, size: Tuple[int, int]) -> None:
         super().__init__()
         self.size = size
+        self.rect = vector.Rect(vector.Vector((0.0, 0.0)), vector.Vector(size))  # Built once for is_inside
         self.state = Maze.State.RUNNING
         self.entities: Set[entity.Entity] = set()
+        self.updated_entities: Set[entity.Entity] = set()
+        self.moved_entities: Set[entity.Entity] = set()
+        self.grid = SpatialHashGrid(size[1])
+        self.entities_by_class: Dict[entity.EntityClass, Set[entity.Entity]] = {}
+        self.tile_map = [[Maze.Tile.FREE for _ in range(size[1])] for _ in range(size[0])]
         self.player_spawns: Dict[int, vector.Vector] = {}
         self.end_timer = timer.Timer()
         self.extra_game_timer = timer.Timer()
         self.hurry_up_timer = timer.Timer()
+        self.forward_event = events.ForwardTimeEvent(0.0)  # Sent at each update: built once
 
     def add_entity(self, entity_: entity.Entity) -> None:
         """Register a new entity in the maze.
@@ -73,7 +258,7 @@ class Maze(observable.Observable):
         if not self.is_inside(entity_.colliding_rect):
             print(f"Warning: Try to add {entity_}. Out of boundaries: {self.size}")
 
-        self.entities.add(entity_)
+        self._register(entity_)
         self.changed(events.NewEntityEvent(entity_))
 
     def remove_entity(self, entity_: entity.Entity) -> None:
@@ -83,8 +268,109 @@ class Maze(observable.Observable):
             entity_ (entity.Entity): The entity to remove
         """
         self.entities.remove(entity_)
+        self.updated_entities.discard(entity_)
+        self.moved_entities.discard(entity_)
+        self.grid.remove(entity_)
+        for klass in entity_classes(type(entity_)):
+            self.entities_by_class[klass].discard(entity_)
+        self._set_tile(entity_, Maze.Tile.FREE)
         self.changed(events.RemovedEntityEvent(entity_))
 
+    def _register(self, entity_: entity.Entity) -> None:
+        """Store the entity in all the containers of the maze (without notifying anyone)"""
+        self.entities.add(entity_)
+        if entity_.removing_timer.is_active or not is_static(type(entity_)):
+            self.updated_entities.add(entity_)
+        self.grid.insert(entity_)
+        for klass in entity_classes(type(entity_)):
+            self.entities_by_class.setdefault(klass, set()).add(entity_)
+        if isinstance(entity_, entity.SolidWall):
+            self._set_tile(entity_, Maze.Tile.SOLID)
+        elif isinstance(entity_, entity.BreakableWall):
+            self._set_tile(entity_, Maze.Tile.BREAKABLE)
+
+    def wake_up(self, entity_: entity.Entity) -> None:
+        """Start updating a static entity of the maze (when it starts removing)
+
+        Args:
+            entity_ (entity.Entity): The entity to update
+        """
+        if entity_ in self.entities:
+            self.updated_entities.add(entity_)
+
+    def _set_tile(self, entity_: entity.Entity, tile: Maze.Tile) -> None:
+        """Update the tile map for a wall (Does nothing for other entities)"""
+        if not isinstance(entity_, (entity.SolidWall, entity.BreakableWall)):
+            return
+
+        i, j = int(entity_.position[0]), int(entity_.position[1])
+        if 0 <= i < self.size[0] and 0 <= j < self.size[1]:
+            self.tile_map[i][j] = tile
+
+    def has_wall(self, rect: vector.Rect) -> bool:
+        """Check if a wall overlaps the rect (using the tile map)
+
+        Args:
+            rect (vector.Rect): Rect in the maze
+
+        Returns:
+            bool
+        """
+        i_min, i_max, j_min, j_max = SpatialHashGrid.span(rect)
+        for i in range(max(0, i_min), min(self.size[0] - 1, i_max) + 1):
+            for j in range(max(0, j_min), min(self.size[1] - 1, j_max) + 1):
+                if self.tile_map[i][j] != Maze.Tile.FREE:
+                    return True
+        return False
+
+    def get_tile(self, i: int, j: int) -> Optional[Maze.Tile]:
+        """Get the walls at a given tile
+
+        Args:
+            i (int): Row of the tile
+            j (int): Column of the tile
+
+        Returns:
+            Optional[Maze.Tile]: The content of the tile. None if it is outside of the maze.
+        """
+        if 0 <= i < self.size[0] and 0 <= j < self.size[1]:
+            return self.tile_map[i][j]
+        return None
+
+    def is_free(self, i: int, j: int) -> bool:
+        """Check that a tile is inside the maze and without walls (in a single test)
+
+        Args:
+            i (int): Row of the tile
+            j (int): Column of the tile
+
+        Returns:
+            bool
+        """
+        return 0 <= i < self.size[0] and 0 <= j < self.size[1] and not self.tile_map[i][j]
+
+    def get_entities(self, klass: entity.EntityClass) -> Set[entity.Entity]:
+        """Get all the entities of a given class (Without scanning all the entities)
+
+        The returned set is the one of the maze: it should not be modified, and should be copied
+        to add or remove entities while iterating.
+
+        Args:
+            klass (entity.EntityClass): Class of the entities
+
+        Returns:
+            Set[entity.Entity]: All the instances of this class in the maze
+        """
+        return self.entities_by_class.get(klass, set())
+
+    def reindex(self, entity_: entity.Entity) -> None:
+        """Called by entities when their colliding rect changes
+
+        Args:
+            entity_ (entity.Entity): The entity that has moved or has been resized
+        """
+        self.grid.update(entity_)
+
     def add_player(self, player: entity.Player) -> None:
         """Add a player to the maze.
 
@@ -111,13 +397,39 @@ class Maze(observable.Observable):
         Returns:
             Set[entity.Entity]: All the other entities in collision with the given rect
         """
-        colliding_entities = set()
+        candidates = self.entities
+        if len(self.entities) >= self.BRUTE_FORCE_LIMIT:
+            candidates = self.grid.query(rect, (entity.Entity,))
+
+        return colliding_entities(rect, filter(condition, candidates))
+
+    def get_collision_of(
+        self,
+        rect: vector.Rect,
+        classes: Tuple[entity.EntityClass, ...],
+        exclude: Optional[entity.Entity] = None,
+    ) -> Set[entity.Entity]:
+        """Get the overlapping entities of some classes
+
+        Faster than `get_collision` with an isinstance condition: the grid is indexed by class.
 
-        for entity_ in filter(condition, self.entities):
-            if rect.collide_with(entity_.colliding_rect):
-                colliding_entities.add(entity_)
+        Args:
+            rect (vector.Rect): A rect to look at
+            classes (Tuple[entity.EntityClass, ...]): Classes of the entities to look for
+            exclude (Optional[entity.Entity]): An entity to ignore (Usually the one asking)
+
+        Returns:
+            Set[entity.Entity]: All the entities of the given classes in collision with the rect
+        """
+        if len(self.entities) < self.BRUTE_FORCE_LIMIT:  # Use the class index rather than isinstance checks
+            candidates = set()
+            for klass in classes:
+                candidates.update(self.get_entities(klass))
+        else:
+            candidates = self.grid.query(rect, classes)
+        candidates.discard(exclude)  # type: ignore
 
-        return colliding_entities
+        return colliding_entities(rect, candidates)
 
     def is_inside(self, rect: vector.Rect) -> bool:
         """Check that the rect belongs to the maze
@@ -128,7 +440,7 @@ class Maze(observable.Observable):
         Returns:
             bool
         """
-        return vector.Rect(vector.Vector((0.0, 0.0)), vector.Vector(self.size)).contains(rect)
+        return self.rect.contains(rect)
 
     def get_player_count(self) -> int:
         """Number of player in current maze.
@@ -136,7 +448,7 @@ class Maze(observable.Observable):
         Returns:
             int: The number of player
         """
-        return len(list(filter(lambda entity_: isinstance(entity_, entity.Player), self.entities)))
+        return len(self.get_entities(entity.Player))
 
     def hurry_up(self) -> None:
         """Called by the game when the time is almost up"""
@@ -151,24 +463,23 @@ class Maze(observable.Observable):
             delay (float): Seconds spent since last call.
         """
         # Forward to entity
-        for entity_ in self.entities.copy():
+        for entity_ in self.updated_entities.copy():
             entity_.update(delay)
 
-        self.changed(events.ForwardTimeEvent(delay))
+        self.forward_event.delay = delay
+        self.changed(self.forward_event)
 
         if self.extra_game_timer.update(delay):
             self.extra_game_timer.reset()
             self.extra_game_timer.start(float("inf"))  # Block extra game timer
-            for entity_ in self.entities.copy():
-                if isinstance(entity_, entity.Enemy):
-                    entity_.extra_game(False)
-                if isinstance(entity_, entity.ExtraLetter):
-                    entity_.remove()
+            for entity_ in self.get_entities(entity.Enemy):
+                cast(entity.Enemy, entity_).extra_game(False)
+            for entity_ in self.get_entities(entity.ExtraLetter).copy():
+                entity_.remove()
 
         if self.hurry_up_timer.update(delay):
-            for entity_ in self.entities:
-                if isinstance(entity_, entity.Enemy):
-                    entity_.enraged()
+            for entity_ in self.get_entities(entity.Enemy):
+                cast(entity.Enemy, entity_).enraged()
 
         # XXX: The state cannot change even if a player bombs itself during the end timer
         if self.end_timer.is_active:
@@ -176,15 +487,12 @@ class Maze(observable.Observable):
             # self.changed(events.MazeEndingEvent())
             return
 
-        players, enemies, coins = 0, 0, 0
-        for entity_ in self.entities:
-            if isinstance(entity_, entity.Player):
-                players += 1
-            if isinstance(entity_, entity.Enemy):
-                enemies += 1
-            if isinstance(entity_, entity.Coin):
-                if not entity_.removing_timer.is_active:
-                    coins += 1
+        players = len(self.get_entities(entity.Player))
+        enemies = len(self.get_entities(entity.Enemy))
+        coins = 0
+        for entity_ in self.get_entities(entity.Coin):
+            if not entity_.removing_timer.is_active:
+                coins += 1
 
         if not players:
             self.state = Maze.State.FAILED
@@ -202,10 +510,9 @@ class Maze(observable.Observable):
             if not self.extra_game_timer.is_active:
                 self.extra_game_timer.start(self.EXTRA_GAME_DELAY)
                 self.changed(events.ExtraGameEvent())
-                for entity_ in self.entities:
-                    if isinstance(entity_, entity.Enemy):
-                        if not entity_.removing_timer.is_active:
-                            entity_.extra_game(True)
+                for entity_ in self.get_entities(entity.Enemy):
+                    if not entity_.removing_timer.is_active:
+                        cast(entity.Enemy, entity_).extra_game(True)
 
     def __str__(self) -> str:
         identifier_to_repr = {i: r for r, i in Maze.PLAYER_SPAWNS.items()}
@@ -269,7 +576,7 @@ class Maze(observable.Observable):
                     has_coin = True
 
                 entity_ = klass(maze, vector.Vector((float(i), float(j))))
-                maze.entities.add(entity_)
+                maze._register(entity_)  # pylint: disable=protected-access
 
                 if isinstance(entity_, entity.Teleporter):
                     teleporters.append(entity_)
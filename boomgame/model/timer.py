@@ -24,6 +24,8 @@ class Timer:
         current (float): Either the time left (decrease mode), or time elapsed (increase mode)
     """
 
+    __slots__ = ("increase", "is_active", "total", "current")
+
     def __init__(self, increase: bool = True) -> None:
         self.increase = increase
         self.is_active = False
@@ -83,3 +85,16 @@ class Timer:
         The timer is no longer active and can be restarted. Can be called even if not done.
         """
         self.is_active = False
+
+
+class InactiveTimer(Timer):
+    """Timer that is never started
+
+    Can be shared as a placeholder by objects that rarely need a timer: it is only replaced by a real timer
+    when it has to be started.
+    """
+
+    __slots__ = ()
+
+    def start(self, total: float) -> None:
+        raise RuntimeError("An inactive timer cannot be started")
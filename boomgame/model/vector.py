@@ -13,13 +13,19 @@ import enum
 
 
 class Vector(Tuple[float, float]):
-    """Simple 2D vector computations useful for positions and directions"""
+    """Simple 2D vector computations useful for positions and directions
+
+    Operations are written for 2D vectors (rather than looping over the coordinates) as they are
+    used by the model at each update.
+    """
+
+    __slots__ = ()
 
     def __add__(self, other: object) -> Vector:
         if isinstance(other, tuple):
-            if len(other) != len(self):
+            if len(other) != 2:
                 raise RuntimeError("Sizes do not match")
-            return Vector((x + y for x, y in zip(self, other)))
+            return _new_vector(Vector, (self[0] + other[0], self[1] + other[1]))
         return NotImplemented
 
     def __radd__(self, other: object) -> Vector:
@@ -27,9 +33,9 @@ class Vector(Tuple[float, float]):
 
     def __mul__(self, other: object) -> Vector:
         if isinstance(other, (int, float)):
-            return Vector((other * x for x in self))
+            return _new_vector(Vector, (other * self[0], other * self[1]))
         if isinstance(other, tuple):
-            return Vector((x * y for x, y in zip(self, other)))
+            return _new_vector(Vector, (self[0] * other[0], self[1] * other[1]))
         return NotImplemented
 
     def __rmul__(self, other: object) -> Vector:
@@ -37,23 +43,32 @@ class Vector(Tuple[float, float]):
 
     def __sub__(self, other: object) -> Vector:
         if isinstance(other, tuple):
-            return self + -1 * Vector(other)
+            if len(other) != 2:
+                raise RuntimeError("Sizes do not match")
+            return _new_vector(Vector, (self[0] - other[0], self[1] - other[1]))
         return NotImplemented
 
     def __rsub__(self, other: object) -> Vector:
-        return -1 * (self - other)
+        if isinstance(other, tuple):
+            if len(other) != 2:
+                raise RuntimeError("Sizes do not match")
+            return _new_vector(Vector, (other[0] - self[0], other[1] - self[1]))
+        return NotImplemented
 
     def apply(self, func: Callable[[float], float]) -> Vector:
         """Apply a function to all the vector"""
-        return Vector((func(x) for x in self))
+        return _new_vector(Vector, (func(self[0]), func(self[1])))
 
     def int_part(self) -> Vector:
         """Return the integer part of the vector"""
-        return Vector((x // 1 for x in self))
+        return _new_vector(Vector, (self[0] // 1, self[1] // 1))
 
     def frac_part(self) -> Vector:
         """Return the fractionnal part of the vector"""
-        return Vector((x % 1 for x in self))
+        return _new_vector(Vector, (self[0] % 1, self[1] % 1))
+
+
+_new_vector = tuple.__new__  # Build vectors without going through the whole type call
 
 
 class Rect:
@@ -62,6 +77,8 @@ class Rect:
     Could probably use pygame.Rect but it does not supports floats so...
     """
 
+    __slots__ = ("x", "y", "width", "height")
+
     def __init__(self, position: Vector, size: Vector) -> None:
         self.x = position[0]
         self.y = position[1]
@@ -98,15 +115,22 @@ class Direction(enum.Enum):
     RIGHT = (0.0, 1.0)
     LEFT = (0.0, -1.0)
 
+    # Members are singletons compared by identity: hash them by identity too (in C),
+    # rather than with the python level Enum.__hash__. Directions are used as keys in many lookup tables.
+    __hash__ = object.__hash__
+
     def __init__(self, *args) -> None:
         super().__init__()
         self.vector = Vector(args)
 
     @staticmethod
     def get_opposite_direction(direction: Direction) -> Direction:
-        return {
-            Direction.UP: Direction.DOWN,
-            Direction.DOWN: Direction.UP,
-            Direction.RIGHT: Direction.LEFT,
-            Direction.LEFT: Direction.RIGHT,
-        }[direction]
+        return OPPOSITE_DIRECTIONS[direction]
+
+
+OPPOSITE_DIRECTIONS = {  # Built once (rather than at each get_opposite_direction call)
+    Direction.UP: Direction.DOWN,
+    Direction.DOWN: Direction.UP,
+    Direction.RIGHT: Direction.LEFT,
+    Direction.LEFT: Direction.RIGHT,
+}
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+from typing import Dict
+
 import pygame
 import pygame.mixer
 
 from ..designpattern import event, observer
-from ..model import events, maze
+from ..model import entity, events, maze
 from . import load_sound
 from . import entity_sound
 
@@ -38,8 +40,10 @@ class MazeSound(observer.Observer):
         self.hurry_up_sound = load_sound(self.hurry_up)
         self.extra_life_sound = load_sound(self.extra_life)
 
-        # Set of all the views for each component of the maze
-        self.entity_sounds = {entity_sound.EntitySound.from_entity(entity_) for entity_ in self.maze.entities}
+        # Sounds of each component of the maze (by entity)
+        self.entity_sounds: Dict[entity.Entity, entity_sound.EntitySound] = {
+            entity_: entity_sound.EntitySound.from_entity(entity_) for entity_ in self.maze.entities
+        }
 
         # Start the music if loaded
         try:
@@ -49,14 +53,12 @@ class MazeSound(observer.Observer):
 
     def notify(self, event_: event.Event) -> None:
         if isinstance(event_, events.NewEntityEvent):
-            self.entity_sounds.add(entity_sound.EntitySound.from_entity(event_.entity))
+            self.entity_sounds[event_.entity] = entity_sound.EntitySound.from_entity(event_.entity)
             return
 
         if isinstance(event_, events.RemovedEntityEvent):
-            for sound in self.entity_sounds:
-                if sound.entity == event_.entity:
-                    self.entity_sounds.remove(sound)
-                    return
+            if self.entity_sounds.pop(event_.entity, None) is not None:
+                return
 
         if isinstance(event_, events.MazeFailedEvent):
             pygame.mixer.music.stop()
@@ -0,0 +1,11 @@
+"""Version of the game (kept free of any heavy import)"""
+
+__version__ = "0.4.6"
+
+
+def display_version() -> None:
+    """Entry point of boom_version command
+
+    Print the version on stdout
+    """
+    print(__version__)
@@ -71,6 +71,9 @@ class EntityView(view.Sprite, observer.Observer):
         Only used for walls for now.
         """
 
+    def entity_moved(self) -> None:
+        """Called before display if the observed entity has moved (See `maze.Maze.moved_entities`)"""
+
 
 class FakeEntityView(EntityView):
     """Base class for Fake Entity
@@ -202,19 +205,16 @@ class MovingEntityView(EntityView):
         i = self.direction_to_row[entity_.current_direction]
         self.select_sprite(i, 0)
 
-    def notify(self, event_: event.Event) -> None:
-        super().notify(event_)
-
-        if isinstance(event_, events.MovedEntityEvent):
-            entity_ = cast(entity.MovingEntity, event_.entity)
-            self.position = inflate_to_reality(entity_.position)
-            if not entity_.current_direction:  # End of a movement probably
-                self.select_sprite(self.direction_to_row[entity_.current_direction], 0)
-                return
+    def entity_moved(self) -> None:
+        entity_ = cast(entity.MovingEntity, self.entity)
+        self.position = inflate_to_reality(entity_.position)
+        if not entity_.current_direction:  # End of a movement probably
+            self.select_sprite(self.direction_to_row[entity_.current_direction], 0)
+            return
 
-            i = self.direction_to_row[entity_.current_direction]
-            j = int(entity_.try_moving_since / self.RATE) % self.COLUMNS
-            self.select_sprite(i, j)
+        i = self.direction_to_row[entity_.current_direction]
+        j = int(entity_.try_moving_since / self.RATE) % self.COLUMNS
+        self.select_sprite(i, j)
 
 
 class PlayerView(MovingEntityView):
@@ -250,7 +250,7 @@ class PlayerView(MovingEntityView):
 
         if isinstance(event_, events.LifeLossEvent):
             # In case of a life loss, let's update the sprite like it would be done when moving
-            super().notify(events.MovedEntityEvent(event_.entity))
+            self.entity_moved()
 
     def display(self, surface: pygame.surface.Surface) -> None:
         if not self.entity.shield.is_active:
@@ -299,12 +299,12 @@ class EnemyView(MovingEntityView):
         self.entity: entity.Enemy
         self.alien_view = AlienView(self.entity)
 
-    def notify(self, event_: event.Event) -> None:
-        super().notify(event_)
+    def entity_moved(self) -> None:
+        super().entity_moved()
+        self.alien_view.entity_moved()
 
-        if isinstance(event_, events.MovedEntityEvent):
-            if self.entity.firing_timer.is_active:
-                self.select_sprite(self.FIRING_ROW, self.direction_to_row[self.entity.current_direction])
+        if self.entity.firing_timer.is_active:
+            self.select_sprite(self.FIRING_ROW, self.direction_to_row[self.entity.current_direction])
 
     def display(self, surface: pygame.surface.Surface) -> None:
         if self.entity.is_alien:
@@ -390,11 +390,8 @@ class BulletView(EntityView):
         self.entity: entity.Bullet
         self.rotation = self.direction_to_rotation[entity_.display_direction]
 
-    def notify(self, event_: event.Event) -> None:
-        super().notify(event_)
-
-        if isinstance(event_, events.MovedEntityEvent):
-            self.position = inflate_to_reality(event_.entity.position)
+    def entity_moved(self) -> None:
+        self.position = inflate_to_reality(self.entity.position)
 
     def display(self, surface: pygame.surface.Surface) -> None:
         image = pygame.surface.Surface(self.SPRITE_SIZE).convert_alpha()
@@ -424,16 +421,15 @@ class LightboltView(BulletView):
 class FlameView(BulletView):
     REMOVING_STEPS = [(0, 0), (0, 1), (0, 2), (0, 3), (0, 4), (0, 4), (0, 3), (0, 2), (0, 1), (0, 0)]
 
-    def notify(self, event_: event.Event) -> None:
-        super().notify(event_)
+    def entity_moved(self) -> None:
+        super().entity_moved()
         if self.entity.removing_timer.is_active:
             return
 
-        if isinstance(event_, events.MovedEntityEvent):
-            if self.entity.distance < self.entity.RANGE:
-                j = int(self.COLUMNS * self.entity.distance / self.entity.RANGE)
-                self.select_sprite(0, j)
-                self.removing_steps = self.REMOVING_STEPS[j:]
+        if self.entity.distance < self.entity.RANGE:
+            j = int(self.COLUMNS * self.entity.distance / self.entity.RANGE)
+            self.select_sprite(0, j)
+            self.removing_steps = self.REMOVING_STEPS[j:]
 
     def __lt__(self, other) -> bool:
         # Improve Flame visualization by enforcing an order between Flames
@@ -461,15 +457,14 @@ class MissileView(BulletView):
     REMOVING_STEPS = [(0, 2), (0, 3), (0, 4), (0, 5), (0, 6)]
     ROTATE_RATE = 0.1
 
-    def notify(self, event_: event.Event) -> None:
-        super().notify(event_)
+    def entity_moved(self) -> None:
+        super().entity_moved()
 
         if self.entity.removing_timer.is_active:
             return
 
-        if isinstance(event_, events.MovedEntityEvent):
-            missile = cast(entity.Missile, self.entity)
-            self.select_sprite(0, int(missile.alive_since.current / self.ROTATE_RATE) % 2)
+        missile = cast(entity.Missile, self.entity)
+        self.select_sprite(0, int(missile.alive_since.current / self.ROTATE_RATE) % 2)
 
     def display(self, surface: pygame.surface.Surface) -> None:
         EntityView.display(self, surface)
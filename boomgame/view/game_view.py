@@ -55,12 +55,24 @@ class GameView(view.View, observer.Observer):
         if self.model.state == game.GameModel.State.MENU:
             return
 
-        # Let's draw on a temporary surface that matches the size
-        real_game_surface = pygame.surface.Surface(self.size).convert_alpha()
+        if surface.get_size() != self.size:  # Draw on a temporary surface that matches the size and inflate it
+            real_game_surface = pygame.surface.Surface(self.size).convert_alpha()
+            self.display(real_game_surface)
 
-        self.panel_view.display(real_game_surface.subsurface(self.panel_rect))
+            surface.fill((0, 0, 0))
+            width, height = surface.get_size()
+            ratio = min(width / self.size[0], height / self.size[1])
+            game_size = (int(self.size[0] * ratio), int(self.size[1] * ratio))
 
-        maze_surface = real_game_surface.subsurface(self.maze_rect)
+            game_rect = pygame.rect.Rect(((width - game_size[0]) // 2, (height - game_size[1]) // 2), game_size)
+            pygame.transform.scale(real_game_surface, game_size, surface.subsurface(game_rect))
+            return
+
+        # The surface already matches the size: draw directly on it (no allocation nor scaling each frame)
+        surface.fill((0, 0, 0))
+        self.panel_view.display(surface.subsurface(self.panel_rect))
+
+        maze_surface = surface.subsurface(self.maze_rect)
         if self.model.state == game.GameModel.State.RUNNING:
             self.maze_view.display(maze_surface)
         elif self.model.state == game.GameModel.State.START_SCREEN:
@@ -68,18 +80,6 @@ class GameView(view.View, observer.Observer):
         else:
             self.bonus_text.display(maze_surface)
 
-        # Draw on the real surface and inflate at maximum size
-        surface.fill((0, 0, 0))
-
-        width, height = surface.get_size()
-        ratio = min(width / self.size[0], height / self.size[1])
-        game_size = (int(self.size[0] * ratio), int(self.size[1] * ratio))
-
-        game_rect = pygame.rect.Rect(((width - game_size[0]) // 2, (height - game_size[1]) // 2), game_size)
-        inflated_game_surface = surface.subsurface(game_rect)
-
-        pygame.transform.scale(real_game_surface, game_size, inflated_game_surface)
-
 
 class CenteredText(view.View):
     """Display some text"""
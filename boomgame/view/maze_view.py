@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Set
+from typing import Dict, Set
 
 import pygame
 import pygame.rect
 import pygame.surface
 
 from ..designpattern import event, observer
-from ..model import events, maze
+from ..model import entity, events, maze
 from . import TILE_SIZE, inflate_to_reality
 from . import animation, entity_view, view
 
@@ -42,9 +42,11 @@ class MazeView(view.View, observer.Observer):
         self.background = pygame.surface.Surface(self.size).convert_alpha()
         self._build_background(style)
 
-        # Set of all the views for each component of the maze
-        self.entity_views = {entity_view.EntityView.from_entity(entity_) for entity_ in self.maze.entities}
-        for view_ in self.entity_views:
+        # Views of each component of the maze (by entity)
+        self.entity_views: Dict[entity.Entity, entity_view.EntityView] = {
+            entity_: entity_view.EntityView.from_entity(entity_) for entity_ in self.maze.entities
+        }
+        for view_ in self.entity_views.values():
             view_.set_style(style)
 
         # Animations
@@ -86,7 +88,13 @@ class MazeView(view.View, observer.Observer):
         # And the components of the maze
         maze_surface = surface.subsurface(self.maze_rect)
 
-        for view_ in sorted(self.entity_views):
+        for entity_ in self.maze.moved_entities:  # Pull the moves of the entities (Rather than an event at each move)
+            moved_view = self.entity_views.get(entity_)
+            if moved_view:
+                moved_view.entity_moved()
+        self.maze.moved_entities.clear()
+
+        for view_ in sorted(self.entity_views.values()):
             view_.display(maze_surface)
 
         # Display animations
@@ -95,16 +103,14 @@ class MazeView(view.View, observer.Observer):
 
     def notify(self, event_: event.Event) -> None:
         if isinstance(event_, events.NewEntityEvent):
-            self.entity_views.add(entity_view.EntityView.from_entity(event_.entity))
+            self.entity_views[event_.entity] = entity_view.EntityView.from_entity(event_.entity)
             event_.handled = True
             return
 
         if isinstance(event_, events.RemovedEntityEvent):
-            for view_ in self.entity_views:
-                if view_.entity == event_.entity:  # FIXME: Directly remove ?
-                    self.entity_views.remove(view_)
-                    event_.handled = True
-                    return
+            if self.entity_views.pop(event_.entity, None) is not None:
+                event_.handled = True
+                return
 
         if isinstance(event_, events.MazeFailedEvent):
             self.animations.add(animation.GameOverSlider(self))
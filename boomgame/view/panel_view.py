@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import pygame
 import pygame.font
@@ -33,12 +33,30 @@ def display_with_shadow(
             The shadow is displayed 3 pixels right and down.
         shadow_offset (Tuple[int, int]): Offset of the shadow
     """
-    # Build the shadow image
+    surface.blits(shadow_blits(image, position, shadow_offset), doreturn=False)
+
+
+def build_shadow(image: pygame.surface.Surface) -> pygame.surface.Surface:
+    """Build the shadow image of an image"""
     shadow = image.copy()
     shadow.fill((0, 0, 0, 200), special_flags=pygame.BLEND_RGBA_MIN)
+    return shadow
+
+
+def shadow_blits(
+    image: pygame.surface.Surface,
+    position: Tuple[int, int],
+    shadow_offset: Tuple[int, int],
+    shadow: Optional[pygame.surface.Surface] = None,
+) -> List[Tuple[pygame.surface.Surface, Tuple[int, int]]]:
+    """Blit sequence (for `Surface.blits`) of an image with an underlying shadow.
+
+    See `display_with_shadow`. The shadow is built from the image if not given.
+    """
+    if shadow is None:
+        shadow = build_shadow(image)
 
-    surface.blit(shadow, (position[0] + shadow_offset[0], position[1] + shadow_offset[1]))
-    surface.blit(image, position)
+    return [(shadow, (position[0] + shadow_offset[0], position[1] + shadow_offset[1])), (image, position)]
 
 
 class PanelView(view.ImageView):
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from typing import Optional, Tuple
 
 import pygame
@@ -16,11 +17,14 @@ from .. import resources
 from . import TILE_SIZE
 
 
+@functools.lru_cache(maxsize=None)
 def load_image(file_name: str, size: Optional[Tuple[int, int]] = None) -> pygame.surface.Surface:
     """Load an image from the image folder (boomgame/data/image).
 
     Should only be called when the main window (mode) has been set.
 
+    Images are loaded once for each (file_name, size) and then shared: they should not be modified.
+
     Args:
         file_name (str): image file
         size (Optional, Tuple[int, int]): Convert the image to this size. (in pixels)